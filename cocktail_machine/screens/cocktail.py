@@ -18,6 +18,7 @@ from kivy.uix.popup import Popup
 from kivy.animation import Animation
 from kivy.clock import Clock
 from kivy.metrics import dp
+from functools import partial
 import asyncio
 import threading
 
@@ -38,40 +39,43 @@ except Exception as e:
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from utils.round_display import RoundScreen, DecoTransition
 
+# Fabriques des colonnes d'IngredientItem : le style constant est figé une
+# fois pour toutes, seul le texte varie d'un ingrédient à l'autre
+_make_name_label = partial(
+    Label,
+    size_hint_x=0.6,
+    color=(0.97, 0.96, 0.91, 1),  # Crème
+    halign='left',
+    text_size=(dp(120), None)
+)
+_make_amount_label = partial(
+    Label,
+    size_hint_x=0.25,
+    color=(0.83, 0.69, 0.22, 1),  # Doré
+    halign='center',
+    bold=True
+)
+_make_status_label = partial(
+    Label,
+    size_hint_x=0.15,
+    halign='center'
+)
+
 class IngredientItem(BoxLayout):
     """Item d'ingrédient avec style Art Déco"""
     
     def __init__(self, ingredient_data, **kwargs):
         super().__init__(orientation='horizontal', **kwargs)
+        self.deco_line = None
         self.ingredient_data = ingredient_data
         self.size_hint_y = None
         self.height = dp(40)
         
-        # Nom de l'ingrédient
-        name_label = Label(
-            text=ingredient_data.get('name', 'Ingrédient'),
-            size_hint_x=0.6,
-            color=(0.97, 0.96, 0.91, 1),  # Crème
-            halign='left',
-            text_size=(dp(120), None)
-        )
-        
-        # Quantité
-        amount_label = Label(
-            text=f"{ingredient_data.get('amount_ml', 0):.0f}ml",
-            size_hint_x=0.25,
-            color=(0.83, 0.69, 0.22, 1),  # Doré
-            halign='center',
-            bold=True
-        )
-        
-        # Statut disponibilité
+        # Nom, quantité et statut de disponibilité
+        name_label = _make_name_label(text=ingredient_data.get('name', 'Ingrédient'))
+        amount_label = _make_amount_label(text=f"{ingredient_data.get('amount_ml', 0):.0f}ml")
         status_icon = "✅" if ingredient_data.get('is_available', False) else "❌"
-        status_label = Label(
-            text=status_icon,
-            size_hint_x=0.15,
-            halign='center'
-        )
+        status_label = _make_status_label(text=status_icon)
         
         self.add_widget(name_label)
         self.add_widget(amount_label)
@@ -92,18 +96,19 @@ class IngredientItem(BoxLayout):
                 width=1
             )
         
-        self.bind(pos=self._update_line)
+        self.fbind('pos', self._update_line)
+        self.fbind('size', self._update_line)
     
     def _update_line(self, *args):
         """Met à jour la ligne décorative"""
-        if hasattr(self, 'deco_line'):
-            self.deco_line.points = [self.x + 10, self.y + 5, self.right - 10, self.y + 5]
+        self.deco_line.points = [self.x + 10, self.y + 5, self.right - 10, self.y + 5]
 
 class PreparationProgress(BoxLayout):
     """Widget de progression de préparation avec style Art Déco"""
     
     def __init__(self, **kwargs):
         super().__init__(orientation='vertical', **kwargs)
+        self.bg_rect = None
         self.size_hint_y = None
         self.height = dp(100)
         
@@ -153,24 +158,30 @@ class PreparationProgress(BoxLayout):
                 radius=[5]
             )
         
-        self.progress_bar.bind(pos=self._update_bg, size=self._update_bg)
+        self.progress_bar.fbind('pos', self._update_bg)
+        self.progress_bar.fbind('size', self._update_bg)
     
     def _update_bg(self, *args):
         """Met à jour le fond de la barre"""
-        if hasattr(self, 'bg_rect'):
-            self.bg_rect.pos = self.progress_bar.pos
-            self.bg_rect.size = self.progress_bar.size
+        self.bg_rect.pos = self.progress_bar.pos
+        self.bg_rect.size = self.progress_bar.size
     
     def update_progress(self, step_name, progress):
         """Met à jour la progression"""
         self.status_label.text = f"Préparation en cours..."
         self.step_label.text = step_name
-        self.progress_bar.value = progress
         
-        # Animation de la barre
+        # Rien à animer si la valeur n'a pas changé
+        if progress == self.progress_bar.value:
+            return
+        
+        # Une seule animation de la barre à la fois
+        Animation.cancel_all(self.progress_bar, 'value')
         if progress > 0:
             anim = Animation(value=progress, duration=0.3)
             anim.start(self.progress_bar)
+        else:
+            self.progress_bar.value = progress
     
     def set_completed(self):
         """Marque comme terminé"""
@@ -12,16 +12,26 @@ from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
 from kivy.uix.label import Label
-from kivy.uix.gridlayout import GridLayout
-from kivy.uix.scrollview import ScrollView
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recyclegridlayout import RecycleGridLayout
 from kivy.uix.image import Image
+from kivy.properties import DictProperty, ObjectProperty
+from kivy.graphics import Color, RoundedRectangle, Line
 from kivy.animation import Animation
 from kivy.clock import Clock
 from kivy.metrics import dp
+from functools import partial
+from operator import attrgetter
 
 import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+# Chemins d'import ajoutés une seule fois, même si le module est rechargé
+_SRC_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+_APP_DIR = os.path.join(os.path.dirname(__file__), '..')
+for _path in (_SRC_DIR, _APP_DIR):
+    if _path not in sys.path:
+        sys.path.append(_path)
 
 try:
     from cocktail_manager import get_cocktail_manager
@@ -33,66 +43,100 @@ except Exception as e:
     COCKTAIL_SUPPORT = False
     print(f"⚠️ Erreur chargement Cocktail Manager: {e}")
 
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from utils.round_display import RoundScreen, DecoTransition
 
+# Dimensions des cartes, converties une seule fois à l'import
+_CARD_SIZE = (dp(150), dp(180))
+_CARD_TEXT_WIDTH = dp(140)
+_GRID_SPACING = dp(15)
+_GRID_PADDING = (dp(10), 0)
+
+# Attributs d'une recette repris dans les données du menu
+_get_cocktail_fields = attrgetter(
+    'id', 'display_name', 'name', 'difficulty',
+    'preparation_time', 'description', 'category', 'is_makeable'
+)
+
+# Fabriques des éléments de CocktailCard : le style constant est figé une
+# fois pour toutes, seul le contenu varie d'une carte à l'autre
+_make_card_image = partial(
+    Image,
+    source='assets/images/cocktails/default.png',
+    size_hint=(1, 0.7),
+    allow_stretch=True,
+    keep_ratio=True
+)
+_make_card_name_label = partial(
+    Label,
+    size_hint=(1, 0.2),
+    font_size='14sp',
+    color=(0.83, 0.69, 0.22, 1),  # Doré
+    bold=True,
+    halign='center',
+    text_size=(_CARD_TEXT_WIDTH, None)
+)
+_make_card_details_label = partial(
+    Label,
+    size_hint=(1, 0.1),
+    font_size='10sp',
+    color=(0.97, 0.96, 0.91, 0.8),  # Crème pâle
+    halign='center'
+)
+
 class CocktailCard(BoxLayout):
-    """Carte de cocktail avec style Art Déco"""
+    """Carte de cocktail avec style Art Déco
+    
+    Utilisée comme viewclass du RecycleView du menu : les cartes sont
+    recyclées au défilement et seules ``cocktail_data``/``callback`` changent.
+    """
     
-    def __init__(self, cocktail_data, callback=None, **kwargs):
+    cocktail_data = DictProperty({})
+    callback = ObjectProperty(None, allownone=True)
+    
+    # Animation de sélection partagée par toutes les cartes
+    _TAP_ANIM = Animation(scale=0.95, duration=0.1) + Animation(scale=1.0, duration=0.1)
+    
+    def __init__(self, cocktail_data=None, callback=None, **kwargs):
         super().__init__(orientation='vertical', **kwargs)
-        self.cocktail_data = cocktail_data
-        self.callback = callback
+        self.bg_rect = None
+        self.border_line = None
+        self.corner_lines = None
         self.size_hint = (None, None)
-        self.size = (dp(150), dp(180))
-        
-        # Image du cocktail
-        self.cocktail_image = Image(
-            source='assets/images/cocktails/default.png',
-            size_hint=(1, 0.7),
-            allow_stretch=True,
-            keep_ratio=True
-        )
+        self.size = _CARD_SIZE
         
-        # Nom du cocktail
-        self.name_label = Label(
-            text=cocktail_data.get('name', 'Cocktail'),
-            size_hint=(1, 0.2),
-            font_size='14sp',
-            color=(0.83, 0.69, 0.22, 1),  # Doré
-            bold=True,
-            halign='center',
-            text_size=(dp(140), None)
-        )
-        
-        # Détails (difficulté, temps)
-        details_text = f"⭐ {cocktail_data.get('difficulty', 1)}/5 • ⏱ {cocktail_data.get('preparation_time', 60)}s"
-        self.details_label = Label(
-            text=details_text,
-            size_hint=(1, 0.1),
-            font_size='10sp',
-            color=(0.97, 0.96, 0.91, 0.8),  # Crème pâle
-            halign='center'
-        )
+        # Image, nom et détails (difficulté, temps)
+        self.cocktail_image = _make_card_image()
+        self.name_label = _make_card_name_label()
+        self.details_label = _make_card_details_label()
         
         self.add_widget(self.cocktail_image)
         self.add_widget(self.name_label)
         self.add_widget(self.details_label)
         
+        # Contenu de la carte
+        self.callback = callback
+        self.cocktail_data = cocktail_data or {}
+        self._refresh_labels()
+        
         # Style Art Déco
         self._setup_art_deco_style()
         
-        # Gestion du touch
-        self.bind(on_touch_down=self.on_cocktail_touch)
-        
         # Animation d'entrée
         DecoTransition.fade_in_gold(self, 0.8)
     
+    def on_cocktail_data(self, instance, cocktail_data):
+        """Met à jour la carte quand le RecycleView lui assigne un cocktail"""
+        self._refresh_labels()
+    
+    def _refresh_labels(self):
+        """Remplit le nom et les détails depuis cocktail_data"""
+        cocktail_data = self.cocktail_data
+        self.name_label.text = cocktail_data.get('name', 'Cocktail')
+        self.details_label.text = f"⭐ {cocktail_data.get('difficulty', 1)}/5 • ⏱ {cocktail_data.get('preparation_time', 60)}s"
+    
     def _setup_art_deco_style(self):
         """Applique le style Art Déco à la carte"""
         with self.canvas.before:
-            from kivy.graphics import Color, RoundedRectangle, Line
-            
             # Fond noir semi-transparent
             Color(0.04, 0.04, 0.04, 0.9)
             self.bg_rect = RoundedRectangle(
@@ -120,24 +164,60 @@ class CocktailCard(BoxLayout):
     
     def _update_graphics(self, *args):
         """Met à jour les graphiques quand position/taille change"""
-        if hasattr(self, 'bg_rect'):
-            self.bg_rect.pos = self.pos
-            self.bg_rect.size = self.size
+        x, y, right = self.x, self.y, self.right
+        self.bg_rect.pos = self.pos
+        self.bg_rect.size = self.size
+        self.border_line.rounded_rectangle = (x, y, self.width, self.height, 10)
         
-        if hasattr(self, 'border_line'):
-            self.border_line.rounded_rectangle = (self.x, self.y, self.width, self.height, 10)
+        left_corner, right_corner = self.corner_lines
+        left_corner.points = [x + 15, y + 15, x + 25, y + 15, x + 20, y + 20]
+        right_corner.points = [right - 25, y + 15, right - 15, y + 15, right - 20, y + 20]
     
-    def on_cocktail_touch(self, instance, touch):
-        """Gestion du touch sur la carte cocktail"""
-        if self.collide_point(*touch.pos):
-            # Animation de sélection
-            anim = Animation(scale=0.95, duration=0.1) + Animation(scale=1.0, duration=0.1)
-            anim.start(self)
-            
-            if self.callback:
-                Clock.schedule_once(lambda dt: self.callback(self.cocktail_data), 0.2)
-            return True
-        return False
+    def select(self):
+        """Sélectionne la carte (touch routé par CocktailGrid)"""
+        # Animation de sélection
+        CocktailCard._TAP_ANIM.start(self)
+        
+        if self.callback:
+            Clock.schedule_once(lambda dt: self.callback(self.cocktail_data), 0.2)
+
+class CocktailGrid(RecycleGridLayout):
+    """Grille recyclée des cartes avec un dispatcher de touch unique
+    
+    Au lieu que chaque carte teste le touch, la grille calcule directement
+    la cellule touchée à partir de la géométrie fixe des cartes.
+    """
+    
+    def on_touch_down(self, touch):
+        """Route le touch vers la carte située sous le doigt"""
+        index = self._card_index_at(*touch.pos)
+        if index is not None:
+            card = self.recycleview.view_adapter.get_visible_view(index)
+            if card is not None:
+                card.select()
+                return True
+        return super().on_touch_down(touch)
+    
+    def _card_index_at(self, x, y):
+        """Retourne l'index de la carte sous (x, y), ou None"""
+        if self.recycleview is None or not self.collide_point(x, y):
+            return None
+        
+        card_width, card_height = _CARD_SIZE
+        spacing_x, spacing_y = self.spacing
+        pad_left, pad_top = self.padding[0], self.padding[1]
+        
+        col, offset_x = divmod(x - self.x - pad_left, card_width + spacing_x)
+        row, offset_y = divmod(self.top - pad_top - y, card_height + spacing_y)
+        
+        # Hors grille ou dans l'espacement entre deux cartes
+        if col < 0 or col >= self.cols or row < 0:
+            return None
+        if offset_x > card_width or offset_y > card_height:
+            return None
+        
+        index = int(row) * self.cols + int(col)
+        return index if index < len(self.recycleview.data) else None
 
 class MenuScreen(RoundScreen):
     """Écran menu principal avec design Art Déco"""
@@ -163,18 +243,21 @@ class MenuScreen(RoundScreen):
                 manager = get_cocktail_manager()
                 cocktails = manager.database.get_makeable_cocktails()
                 
-                self.cocktails_data = []
-                for cocktail in cocktails[:10]:  # Limiter à 10 pour l'écran
-                    cocktail_info = {
-                        'id': cocktail.id,
-                        'name': cocktail.display_name or cocktail.name,
-                        'difficulty': cocktail.difficulty,
-                        'preparation_time': cocktail.preparation_time,
-                        'description': cocktail.description,
-                        'category': cocktail.category,
-                        'is_makeable': cocktail.is_makeable
+                # Limiter à 10 pour l'écran
+                self.cocktails_data = [
+                    {
+                        'id': cocktail_id,
+                        'name': display_name or name,
+                        'difficulty': difficulty,
+                        'preparation_time': preparation_time,
+                        'description': description,
+                        'category': category,
+                        'is_makeable': is_makeable
                     }
-                    self.cocktails_data.append(cocktail_info)
+                    for (cocktail_id, display_name, name, difficulty,
+                         preparation_time, description, category, is_makeable)
+                    in map(_get_cocktail_fields, cocktails[:10])
+                ]
                 
                 print(f"✅ {len(self.cocktails_data)} cocktails chargés")
                 
@@ -223,26 +306,25 @@ class MenuScreen(RoundScreen):
         title_layout.add_widget(title_label)
         title_layout.add_widget(subtitle_label)
         
-        # Grille de cocktails avec scroll
-        scroll = ScrollView(size_hint=(1, 0.65))
+        # Grille de cocktails recyclée : seules les cartes visibles existent
+        self.cocktails_view = RecycleView(size_hint=(1, 0.65), viewclass=CocktailCard)
         
-        cocktails_grid = GridLayout(
+        cocktails_grid = CocktailGrid(
             cols=2,
-            spacing=dp(15),
+            spacing=_GRID_SPACING,
             size_hint_y=None,
-            padding=(dp(10), 0)
+            padding=_GRID_PADDING,
+            default_size=_CARD_SIZE,
+            default_size_hint=(None, None)
         )
         cocktails_grid.bind(minimum_height=cocktails_grid.setter('height'))
+        self.cocktails_view.add_widget(cocktails_grid)
         
-        # Créer les cartes de cocktails
-        for cocktail_data in self.cocktails_data:
-            card = CocktailCard(
-                cocktail_data,
-                callback=self._on_cocktail_selected
-            )
-            cocktails_grid.add_widget(card)
-        
-        scroll.add_widget(cocktails_grid)
+        # Données des cartes assignées en une fois : une seule passe de layout
+        self.cocktails_view.data = [
+            {'cocktail_data': cocktail_data, 'callback': self._on_cocktail_selected}
+            for cocktail_data in self.cocktails_data
+        ]
         
         # Boutons de navigation
         nav_layout = BoxLayout(
@@ -271,7 +353,7 @@ class MenuScreen(RoundScreen):
         
         # Assembler l'interface
         main_layout.add_widget(title_layout)
-        main_layout.add_widget(scroll)
+        main_layout.add_widget(self.cocktails_view)
         main_layout.add_widget(nav_layout)
         
         self.add_widget(main_layout)
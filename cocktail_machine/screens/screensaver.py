@@ -13,12 +13,12 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.label import Label
 from kivy.uix.widget import Widget
-from kivy.graphics import Color, Line, Ellipse, PushMatrix, PopMatrix, Rotate, Rectangle
+from kivy.graphics import Color, Line, Ellipse, Rectangle, InstructionGroup
 from kivy.animation import Animation
 from kivy.clock import Clock
 from kivy.metrics import dp
 import math
-import time
+import datetime
 import random
 import sys
 import os
@@ -26,56 +26,44 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from utils.round_display import RoundScreen
 
-class DecoRay(Widget):
-    """Rayon Art Déco animé"""
+try:
+    from hardware.pumps import get_pump_manager
+    PUMPS_SUPPORT = True
+except ImportError:
+    PUMPS_SUPPORT = False
+
+# Dimensions des orbes, converties une seule fois à l'import
+_ORB_SIZE = (dp(30), dp(30))
+_ORB_MARGIN = dp(50)
+
+# Tables trigonométriques au dixième de degré (3600 entrées), calculées une
+# seule fois pour éviter cos/sin à chaque image de l'animation
+_TRIG_STEPS = 3600
+_COS = tuple(math.cos(math.radians(i / 10.0)) for i in range(_TRIG_STEPS))
+_SIN = tuple(math.sin(math.radians(i / 10.0)) for i in range(_TRIG_STEPS))
+
+# Rotation des rayons : 0.2° par image
+_ROTATION_STEP = 2
+
+# Pulsation du sunburst : ~2 rad/s à 30 FPS, décalage de 0.2 rad par rayon
+_PULSE_STEP = 38
+_PHASE_OFFSETS = tuple(round(math.degrees(i * 0.2) * 10) for i in range(12))
+
+class DecoRay:
+    """État d'un rayon Art Déco
     
-    def __init__(self, angle=0, length=100, **kwargs):
-        super().__init__(**kwargs)
-        self.angle = angle
-        self.length = length
-        self.opacity_factor = 1.0
-        
-        with self.canvas:
-            PushMatrix()
-            self.rotation = Rotate(angle=self.angle, origin=(0, 0))
-            Color(0.83, 0.69, 0.22, 0.6)  # Doré semi-transparent
-            self.line = Line(points=[0, 0, 0, self.length], width=2)
-            PopMatrix()
-        
-        self.bind(pos=self._update_graphics, size=self._update_graphics)
-        
-        # Animation continue
-        self._start_animation()
+    L'angle est stocké en dixièmes de degré pour indexer directement les
+    tables trigonométriques ; rapport de longueur et décalage de phase
+    sont figés à la création.
+    """
     
-    def _update_graphics(self, *args):
-        """Met à jour les graphiques selon la position"""
-        center_x = self.center_x
-        center_y = self.center_y
-        
-        self.rotation.origin = (center_x, center_y)
-        
-        # Calculer fin du rayon selon l'angle
-        end_x = center_x + self.length * math.cos(math.radians(self.angle))
-        end_y = center_y + self.length * math.sin(math.radians(self.angle))
-        
-        self.line.points = [center_x, center_y, end_x, end_y]
+    __slots__ = ('angle_index', 'length', 'length_ratio', 'phase_offset')
     
-    def _start_animation(self):
-        """Démarre l'animation du rayon"""
-        def update_opacity(dt):
-            # Oscillation de l'opacité
-            t = time.time() * 0.5 + self.angle * 0.02  # Décalage selon l'angle
-            self.opacity_factor = 0.3 + 0.7 * (math.sin(t) + 1) / 2
-            
-            # Rotation lente
-            self.angle += 0.2
-            if self.angle >= 360:
-                self.angle -= 360
-            
-            self.rotation.angle = self.angle
-            self._update_graphics()
-        
-        Clock.schedule_interval(update_opacity, 1/30.0)  # 30 FPS
+    def __init__(self, angle=0, length=100, length_ratio=1.0, phase_offset=0):
+        self.angle_index = round(angle * 10) % _TRIG_STEPS
+        self.length = length
+        self.length_ratio = length_ratio
+        self.phase_offset = phase_offset
 
 class SunburstWidget(Widget):
     """Widget de rayons de soleil Art Déco"""
@@ -85,11 +73,19 @@ class SunburstWidget(Widget):
         self.rays = []
         self.animation_phase = 0
         
-        # Créer les rayons
+        # Créer les rayons (animés par le ticker de l'écran de veille)
         self._create_rays()
         
-        # Animation globale
-        self._start_animation()
+        # Une Line par rayon, regroupées : les rayons ne se chevauchent pas
+        # et leurs points sont modifiés sur place à chaque image
+        self._rays_group = InstructionGroup()
+        self._rays_group.add(Color(0.83, 0.69, 0.22, 0.6))  # Doré semi-transparent
+        self._ray_lines = []
+        for _ in self.rays:
+            line = Line(points=[], width=2, cap='none')
+            self._rays_group.add(line)
+            self._ray_lines.append(line)
+        self.canvas.add(self._rays_group)
     
     def _create_rays(self):
         """Crée les rayons dorés"""
@@ -99,110 +95,132 @@ class SunburstWidget(Widget):
         for i in range(ray_count):
             angle = (360 / ray_count) * i
             # Alterner la longueur des rayons
-            length = base_length if i % 2 == 0 else base_length * 0.7
-            
-            ray = DecoRay(angle=angle, length=length)
-            self.add_widget(ray)
-            self.rays.append(ray)
-        
-        self.bind(size=self._update_ray_lengths)
+            length_ratio = 1.0 if i % 2 == 0 else 0.7
+            self.rays.append(DecoRay(
+                angle=angle,
+                length=base_length * length_ratio,
+                length_ratio=length_ratio,
+                phase_offset=_PHASE_OFFSETS[i]
+            ))
     
-    def _update_ray_lengths(self, *args):
-        """Met à jour la longueur des rayons selon la taille"""
-        if self.rays and self.width and self.height:
-            base_length = min(self.width, self.height) * 0.4
-            
-            for i, ray in enumerate(self.rays):
-                ray.length = base_length if i % 2 == 0 else base_length * 0.7
-                ray._update_graphics()
-    
-    def _start_animation(self):
-        """Animation globale du sunburst"""
-        def animate_sunburst(dt):
-            self.animation_phase += 1
-            
-            # Faire pulser l'ensemble
-            scale_factor = 0.9 + 0.1 * math.sin(self.animation_phase * 0.1)
+    def tick(self, dt):
+        """Fait tourner et pulser tous les rayons en une passe"""
+        steps = _TRIG_STEPS
+        cos_table = _COS
+        sin_table = _SIN
+        
+        phase = self.animation_phase = (self.animation_phase + _PULSE_STEP) % steps
+        base_length = min(self.width, self.height) * 0.4 if self.width and self.height else 150
+        base_length *= 0.9 + 0.1 * sin_table[phase]
+        center_x, center_y = self.center
+        
+        for ray, line in zip(self.rays, self._ray_lines):
+            # Rotation lente
+            index = ray.angle_index = (ray.angle_index + _ROTATION_STEP) % steps
             
-            # Animation de rotation générale très lente
-            rotation_angle = self.animation_phase * 0.1
+            # Pulsation avec décalage de phase par rayon
+            length = ray.length = base_length * ray.length_ratio * (
+                0.8 + 0.2 * sin_table[(phase + ray.phase_offset) % steps]
+            )
             
-            # Appliquer à tous les rayons
-            for i, ray in enumerate(self.rays):
-                # Décalage de phase par rayon
-                phase_offset = i * 0.2
-                ray_scale = scale_factor * (0.8 + 0.2 * math.sin(self.animation_phase * 0.1 + phase_offset))
-                
-                # Mise à jour virtuelle de la longueur
-                base_length = min(self.width, self.height) * 0.4 if self.width and self.height else 150
-                ray.length = (base_length if i % 2 == 0 else base_length * 0.7) * ray_scale
-        
-        Clock.schedule_interval(animate_sunburst, 1/20.0)  # 20 FPS
+            line.points = (
+                center_x,
+                center_y,
+                center_x + length * cos_table[index],
+                center_y + length * sin_table[index]
+            )
 
-class FloatingOrb(Widget):
-    """Orbe flottant décoratif"""
+class FloatingOrb:
+    """Orbe flottant décoratif
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.size = (dp(30), dp(30))
+    Simple état de position/opacité : ses instructions graphiques vivent
+    dans le groupe partagé par tous les orbes de l'écran de veille.
+    """
+    
+    def __init__(self, group, area):
+        self.area = area  # Widget dans lequel l'orbe flotte
+        self.width, self.height = _ORB_SIZE
+        self.x = self.y = 0.0
         self.orb_opacity = 0.7
         
-        with self.canvas:
-            Color(0.83, 0.69, 0.22, self.orb_opacity)  # Doré
-            self.orb_ellipse = Ellipse(pos=self.pos, size=self.size)
-            
-            # Bordure plus claire
-            Color(0.9, 0.8, 0.5, self.orb_opacity * 0.8)
-            self.orb_line = Line(ellipse=(self.x, self.y, self.width, self.height), width=1)
+        # État du flottement (inactif tant que _duration est nul)
+        self._start_x = self._start_y = 0.0
+        self._target_x = self._target_y = 0.0
+        self._start_time = 0.0
+        self._duration = 0.0
         
-        self.bind(pos=self._update_graphics, size=self._update_graphics)
+        self.orb_color = Color(0.83, 0.69, 0.22, self.orb_opacity)  # Doré
+        self.orb_ellipse = Ellipse(pos=(0, 0), size=_ORB_SIZE)
         
-        # Position et mouvement aléatoires
-        self._setup_movement()
+        # Bordure plus claire
+        self.line_color = Color(0.9, 0.8, 0.5, self.orb_opacity * 0.8)
+        self.orb_line = Line(ellipse=(0, 0, self.width, self.height), width=1)
+        
+        for instruction in (self.orb_color, self.orb_ellipse, self.line_color, self.orb_line):
+            group.add(instruction)
+    
+    def _move_to(self, x, y):
+        """Déplace l'orbe et ses graphiques"""
+        self.x = x
+        self.y = y
+        self.orb_ellipse.pos = (x, y)
+        self.orb_line.ellipse = (x, y, self.width, self.height)
     
-    def _update_graphics(self, *args):
-        """Met à jour les graphiques"""
-        self.orb_ellipse.pos = self.pos
-        self.orb_ellipse.size = self.size
-        self.orb_line.ellipse = (self.x, self.y, self.width, self.height)
+    def _set_opacity(self, opacity):
+        """Applique l'opacité aux deux couleurs de l'orbe"""
+        self.orb_color.a = self.orb_opacity * opacity
+        self.line_color.a = self.orb_opacity * 0.8 * opacity
     
     def _setup_movement(self):
         """Configure le mouvement flottant"""
         # Position initiale aléatoire
-        if self.parent:
-            max_x = self.parent.width - self.width
-            max_y = self.parent.height - self.height
-            self.pos = (random.uniform(0, max_x), random.uniform(0, max_y))
+        area = self.area
+        self._move_to(
+            area.x + random.uniform(0, area.width - self.width),
+            area.y + random.uniform(0, area.height - self.height)
+        )
         
-        # Démarrer animation de flottement
-        self._animate_float()
+        # Démarrer le flottement
+        self._animate_float(Clock.get_time())
     
-    def _animate_float(self):
-        """Animation de flottement"""
-        if not self.parent:
-            return
-        
+    def _animate_float(self, now, delay=0.0):
+        """Choisit la prochaine destination du flottement"""
         # Nouvelle position aléatoire
-        margin = dp(50)
-        new_x = random.uniform(margin, self.parent.width - self.width - margin)
-        new_y = random.uniform(margin, self.parent.height - self.height - margin)
-        
-        # Animation vers la nouvelle position
-        duration = random.uniform(8, 15)  # Durée variable
+        area = self.area
+        margin = _ORB_MARGIN
+        self._start_x, self._start_y = self.x, self.y
+        self._target_x = area.x + random.uniform(margin, area.width - self.width - margin)
+        self._target_y = area.y + random.uniform(margin, area.height - self.height - margin)
+        
+        # Durée variable, interpolée par le ticker de l'écran de veille
+        self._start_time = now + delay
+        self._duration = random.uniform(8, 15)
+    
+    def step(self, now):
+        """Avance le flottement à l'instant donné"""
+        if not self._duration:
+            return
         
-        anim = Animation(x=new_x, y=new_y, duration=duration, t='in_out_sine')
+        u = (now - self._start_time) / self._duration
+        if u <= 0:
+            return
         
-        # Programmer la prochaine animation
-        def next_movement(*args):
-            Clock.schedule_once(lambda dt: self._animate_float(), random.uniform(1, 3))
+        if u >= 1:
+            # Arrivé : courte pause avant la prochaine destination
+            self._move_to(self._target_x, self._target_y)
+            self._set_opacity(0.7)
+            self._animate_float(now, random.uniform(1, 3))
+            return
         
-        anim.bind(on_complete=next_movement)
-        anim.start(self)
+        # Opacité : s'estompe jusqu'à mi-parcours (0.3) puis revient (0.7)
+        self._set_opacity(0.7 - 0.4 * math.sin(math.pi * u))
         
-        # Animation d'opacité simultanée
-        opacity_anim = (Animation(opacity=0.3, duration=duration/2, t='in_sine') + 
-                       Animation(opacity=0.7, duration=duration/2, t='out_sine'))
-        opacity_anim.start(self)
+        # Accélération/décélération douce (smoothstep)
+        u = u * u * (3 - 2 * u)
+        self._move_to(
+            self._start_x + (self._target_x - self._start_x) * u,
+            self._start_y + (self._target_y - self._start_y) * u
+        )
 
 class ClockDisplay(BoxLayout):
     """Affichage de l'heure Art Déco"""
@@ -232,22 +250,29 @@ class ClockDisplay(BoxLayout):
         self.add_widget(self.time_label)
         self.add_widget(self.date_label)
         
-        # Mettre à jour l'heure
+        # Mettre à jour l'heure (à chaque changement de minute)
+        self._cached_date = None
         self._update_time()
-        Clock.schedule_interval(self._update_time, 1.0)
+    
+    def _schedule_next(self, now):
+        """Programme la prochaine mise à jour au début de la minute suivante"""
+        delay = 60 - now.second - now.microsecond / 1e6
+        Clock.schedule_once(self._update_time, delay)
     
     def _update_time(self, *args):
         """Met à jour l'affichage de l'heure"""
-        import datetime
         now = datetime.datetime.now()
         
         # Format heure élégant
-        time_str = now.strftime('%H:%M')
-        self.time_label.text = time_str
+        self.time_label.text = now.strftime('%H:%M')
         
-        # Format date Art Déco
-        date_str = now.strftime('%A %d %B %Y')
-        self.date_label.text = date_str.upper()
+        # Format date Art Déco, recalculé seulement au changement de jour
+        today = now.date()
+        if today != self._cached_date:
+            self._cached_date = today
+            self.date_label.text = now.strftime('%A %d %B %Y').upper()
+        
+        self._schedule_next(now)
 
 class MachineStatus(BoxLayout):
     """Statut de la machine en veille"""
@@ -278,16 +303,12 @@ class MachineStatus(BoxLayout):
         self.add_widget(self.status_label)
         self.add_widget(self.details_label)
         
-        # Animation du statut
-        self._animate_status()
+        # Pulsation du statut, avancée par le ticker de l'écran de veille
+        self._pulse_start = Clock.get_time()
     
-    def _animate_status(self):
-        """Animation du statut"""
-        # Pulsation subtile
-        anim = (Animation(opacity=0.6, duration=2.0, t='in_out_sine') + 
-               Animation(opacity=1.0, duration=2.0, t='in_out_sine'))
-        anim.repeat = True
-        anim.start(self.status_label)
+    def tick(self, now):
+        """Pulsation subtile du statut (période de 4 s)"""
+        self.status_label.opacity = 0.8 + 0.2 * math.sin((now - self._pulse_start) * math.pi / 2)
 
 class ScreensaverScreen(RoundScreen):
     """Écran de veille Art Déco"""
@@ -297,6 +318,10 @@ class ScreensaverScreen(RoundScreen):
         self.name = 'screensaver'
         self.is_active = False
         self.orbs = []
+        self._tick_event = None
+        self._pump_manager = None
+        self.dim_color = None
+        self.dim_overlay = None
         
         self._build_interface()
         
@@ -345,9 +370,12 @@ class ScreensaverScreen(RoundScreen):
         """Crée les orbes décoratifs flottants"""
         orb_count = 6
         
+        # Un seul groupe d'instructions pour tous les orbes
+        self._orb_group = InstructionGroup()
+        parent.canvas.after.add(self._orb_group)
+        
         for i in range(orb_count):
-            orb = FloatingOrb()
-            parent.add_widget(orb)
+            orb = FloatingOrb(self._orb_group, parent)
             self.orbs.append(orb)
             
             # Démarrer le mouvement avec un délai aléatoire
@@ -356,6 +384,49 @@ class ScreensaverScreen(RoundScreen):
                 random.uniform(0, 3)
             )
     
+    def _bind_window_focus(self, bind=True):
+        """Suit (ou cesse de suivre) le focus de la fenêtre pour suspendre le ticker
+        
+        Lié seulement tant que l'écran est affiché : la fenêtre ne garde
+        pas de référence vers l'écran de veille une fois quitté.
+        """
+        try:
+            from kivy.core.window import Window
+        except Exception:
+            return
+        
+        if Window is not None:
+            if bind:
+                Window.bind(focus=self._on_window_focus)
+            else:
+                Window.unbind(focus=self._on_window_focus)
+    
+    def _on_window_focus(self, window, focused):
+        """Aucune image d'animation tant que la fenêtre est en arrière-plan"""
+        if not focused:
+            self._stop_ticker()
+        elif self.is_active:
+            self._start_ticker()
+    
+    def _start_ticker(self):
+        """Démarre le ticker unique des animations de veille (30 FPS)"""
+        if self._tick_event is None:
+            self._tick_event = Clock.schedule_interval(self._tick, 1/30.0)
+    
+    def _stop_ticker(self):
+        """Arrête le ticker des animations de veille"""
+        if self._tick_event is not None:
+            self._tick_event.cancel()
+            self._tick_event = None
+    
+    def _tick(self, dt):
+        """Avance sunburst, orbes flottants et pulsation du statut en une passe"""
+        now = Clock.get_time()
+        self.sunburst.tick(dt)
+        for orb in self.orbs:
+            orb.step(now)
+        self.status_display.tick(now)
+    
     def start_screensaver(self):
         """Active l'économiseur d'écran"""
         if self.is_active:
@@ -393,23 +464,30 @@ class ScreensaverScreen(RoundScreen):
         # En mode réel, on pourrait contrôler la luminosité hardware
         # Ici on simule en assombrissant légèrement l'interface
         
+        if self.dim_overlay is not None:
+            return
+        
         with self.canvas.before:
-            Color(0, 0, 0, 0.3)  # Overlay sombre léger
+            self.dim_color = Color(0, 0, 0, 0.3)  # Overlay sombre léger
             self.dim_overlay = Rectangle(pos=self.pos, size=self.size)
         
         self.bind(pos=self._update_overlay, size=self._update_overlay)
     
     def _update_overlay(self, *args):
         """Met à jour l'overlay d'assombrissement"""
-        if hasattr(self, 'dim_overlay'):
-            self.dim_overlay.pos = self.pos
-            self.dim_overlay.size = self.size
+        self.dim_overlay.pos = self.pos
+        self.dim_overlay.size = self.size
     
     def _restore_screen(self):
         """Restaure la luminosité normale"""
-        if hasattr(self, 'dim_overlay'):
-            self.canvas.before.remove(self.dim_overlay)
-            delattr(self, 'dim_overlay')
+        if self.dim_overlay is None:
+            return
+        
+        self.unbind(pos=self._update_overlay, size=self._update_overlay)
+        self.canvas.before.remove(self.dim_color)
+        self.canvas.before.remove(self.dim_overlay)
+        self.dim_color = None
+        self.dim_overlay = None
     
     def _on_touch(self, instance, touch):
         """Gestion du touch pour sortir de veille"""
@@ -421,15 +499,20 @@ class ScreensaverScreen(RoundScreen):
     
     def update_machine_status(self, status_text, status_color=(0, 1, 0, 0.8)):
         """Met à jour le statut de la machine"""
-        if hasattr(self, 'status_display'):
-            self.status_display.status_label.text = status_text
-            self.status_display.status_label.color = status_color
+        self.status_display.status_label.text = status_text
+        self.status_display.status_label.color = status_color
     
     def on_enter(self):
         """Appelé quand l'écran devient actif"""
         print("🌙 Écran de veille affiché")
         self.start_screensaver()
         
+        # Un seul ticker pour toutes les animations, actif seulement à l'écran
+        self._start_ticker()
+        
+        # Suspendre les animations quand la fenêtre perd le focus
+        self._bind_window_focus()
+        
         # Programmer vérification statut machine
         Clock.schedule_interval(self._check_machine_status, 30.0)  # Toutes les 30s
     
@@ -438,8 +521,10 @@ class ScreensaverScreen(RoundScreen):
         print("🌙 Sortie écran de veille")
         self.is_active = False
         
-        # Arrêter vérifications
+        # Arrêter vérifications et animations
         Clock.unschedule(self._check_machine_status)
+        self._stop_ticker()
+        self._bind_window_focus(bind=False)
         
         # Nettoyer overlay si présent
         self._restore_screen()
@@ -450,24 +535,25 @@ class ScreensaverScreen(RoundScreen):
             # En mode réel, vérifierait le statut des pompes, erreurs, etc.
             # Ici on simule un statut "OK"
             
-            import sys
-            import os
-            sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+            # Gestionnaire de pompes récupéré une seule fois
+            if self._pump_manager is None and PUMPS_SUPPORT:
+                try:
+                    self._pump_manager = get_pump_manager()
+                except RuntimeError:
+                    pass  # Pompes pas encore initialisées, réessai au prochain passage
             
-            try:
-                from hardware.pumps import get_pump_manager
-                manager = get_pump_manager()
-                status = manager.get_system_status()
-                
-                if status.get('emergency_stop', False):
-                    self.update_machine_status('ARRÊT D\'URGENCE', (1, 0, 0, 1))
-                elif status.get('active_pumps', 0) > 0:
-                    self.update_machine_status('PRÉPARATION EN COURS', (1, 1, 0, 1))
-                else:
-                    self.update_machine_status('MACHINE PRÊTE', (0, 1, 0, 0.8))
-                    
-            except:
-                # Mode démo ou erreur
+            if self._pump_manager is None:
+                # Mode démo
+                self.update_machine_status('MACHINE PRÊTE', (0, 1, 0, 0.8))
+                return
+            
+            status = self._pump_manager.get_system_status()
+            
+            if status.get('emergency_stop', False):
+                self.update_machine_status('ARRÊT D\'URGENCE', (1, 0, 0, 1))
+            elif status.get('active_pumps', 0) > 0:
+                self.update_machine_status('PRÉPARATION EN COURS', (1, 1, 0, 1))
+            else:
                 self.update_machine_status('MACHINE PRÊTE', (0, 1, 0, 0.8))
                 
         except Exception as e:
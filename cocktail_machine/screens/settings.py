@@ -19,15 +19,23 @@ from kivy.uix.gridlayout import GridLayout
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.popup import Popup
 from kivy.uix.accordion import Accordion, AccordionItem
+from kivy.graphics import Color, Line, RoundedRectangle, InstructionGroup
 from kivy.animation import Animation
 from kivy.clock import Clock
 from kivy.metrics import dp
+from functools import partial
+import copy
 import json
+import time
 from pathlib import Path
 
 import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Dossier de l'application (hardware/, utils/), ajouté une seule fois
+_APP_DIR = os.path.join(os.path.dirname(__file__), '..')
+if _APP_DIR not in sys.path:
+    sys.path.append(_APP_DIR)
 
 try:
     from hardware.pumps import get_pump_manager
@@ -39,39 +47,160 @@ except Exception as e:
     PUMP_SUPPORT = False
     print(f"⚠️ Erreur chargement système pompes: {e}")
 
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from utils.round_display import RoundScreen, DecoTransition
 
+# Dimensions en dp, calculées une seule fois au chargement du module
+_SETTING_ITEM_HEIGHT = dp(80)
+_SETTING_TEXT_WIDTH = dp(150)
+# Espace sous l'en-tête d'un SettingItem, où passe la ligne décorative
+_SETTING_ITEM_PADDING = (0, 0, 0, dp(32))
+_PUMP_ITEM_HEIGHT = dp(120)
+_HARDWARE_GENERAL_HEIGHT = dp(160)
+_ROW_HEIGHT = dp(40)
+_BUTTON_HEIGHT = dp(50)
+_DIALOG_TEXT_WIDTH = dp(250)
+_SPACING_SMALL = dp(5)
+_SPACING = dp(10)
+_SPACING_LARGE = dp(15)
+
+# Réglages par défaut (ne jamais modifier : copier avant usage)
+_DEFAULT_SETTINGS = {
+    'system': {
+        'auto_clean': True,
+        'screen_brightness': 80,
+        'sound_enabled': True,
+        'demo_mode': False
+    },
+    'cocktails': {
+        'double_dose_multiplier': 2.0,
+        'preparation_timeout': 300,
+        'auto_garnish_reminder': True
+    },
+    'hardware': {
+        'pump_default_speed': 80,
+        'calibration_volume': 50,
+        'emergency_timeout': 10
+    }
+}
+
+# Durée de validité du statut pompes lu auprès du gestionnaire (secondes)
+_PUMP_STATUS_TTL = 1.0
+
+# Pompes affichées en mode démo
+_DEMO_PUMPS = (
+    {'id': 'pump_1', 'ingredient': 'Gin', 'calibration_factor': 1.0, 'enabled': True, 'status': 'idle'},
+    {'id': 'pump_2', 'ingredient': 'Vodka', 'calibration_factor': 0.95, 'enabled': True, 'status': 'idle'},
+    {'id': 'pump_7', 'ingredient': 'Sprite', 'calibration_factor': 1.1, 'enabled': True, 'status': 'idle'},
+)
+
+
+def _parse_volume(value):
+    """Convertit une saisie de volume en nombre, ou None si elle n'est pas numérique"""
+    if isinstance(value, (int, float)):
+        return value  # Déjà numérique : rien à analyser
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+# Réglages affichés par catégorie : (clé, contrôle, titre, description)
+# Contrôle : ('switch',) ou ('slider', min, max, pas, 'int' | 'rounded')
+_SETTINGS_SCHEMA = (
+    ('system', '🔧 Système', (
+        ('auto_clean', ('switch',),
+         'Nettoyage automatique', 'Nettoyage des pompes après chaque cocktail'),
+        ('screen_brightness', ('slider', 20, 100, 10, 'int'),
+         'Luminosité écran', 'Réglage de la luminosité (20-100%)'),
+        ('sound_enabled', ('switch',),
+         'Sons système', 'Activer les sons et notifications'),
+        ('demo_mode', ('switch',),
+         'Mode démonstration', 'Simulation sans hardware réel'),
+    )),
+    ('cocktails', '🍸 Cocktails', (
+        ('double_dose_multiplier', ('slider', 1.5, 3.0, 0.1, 'rounded'),
+         'Multiplicateur double dose', 'Facteur pour les doubles doses (1.5-3.0x)'),
+        ('preparation_timeout', ('slider', 60, 600, 30, 'int'),
+         'Timeout préparation', 'Temps limite pour préparer (60-600s)'),
+        ('auto_garnish_reminder', ('switch',),
+         'Rappel garnitures', 'Rappel automatique pour les garnitures'),
+    )),
+    ('hardware', '⚡ Hardware', (
+        ('pump_default_speed', ('slider', 40, 100, 10, 'int'),
+         'Vitesse pompes', 'Vitesse par défaut des pompes (40-100%)'),
+        ('emergency_timeout', ('slider', 5, 30, 5, 'int'),
+         'Timeout d\'urgence', 'Délai d\'arrêt d\'urgence (5-30s)'),
+    )),
+)
+
+# Fabriques des widgets de PumpCalibrationItem : le style constant est figé
+# une fois pour toutes, seuls le texte et la couleur varient d'une pompe à l'autre
+_make_pump_title_label = partial(
+    Label,
+    color=(0.83, 0.69, 0.22, 1),
+    font_size='14sp',
+    bold=True,
+    size_hint_y=0.2,
+    halign='left'
+)
+
+_make_pump_factor_label = partial(
+    Label,
+    size_hint_x=0.6,
+    color=(0.83, 0.69, 0.22, 1),
+    bold=True
+)
+
+_make_pump_status_label = partial(
+    Label,
+    size_hint_y=0.2,
+    font_size='10sp'
+)
+
+_make_volume_input = partial(
+    TextInput,
+    text='50',
+    size_hint_x=0.3,
+    multiline=False,
+    input_filter='float'
+)
+
 class SettingItem(BoxLayout):
     """Item de réglage avec style Art Déco"""
     
+    # Tuples partagés par tous les items (immuables)
+    _GOLD = (0.83, 0.69, 0.22, 1)  # Doré
+    _CREAM_DIM = (0.97, 0.96, 0.91, 0.7)  # Crème pâle
+    _LINE_GOLD = (0.83, 0.69, 0.22, 0.3)
+    _TEXT_SIZE = (_SETTING_TEXT_WIDTH, None)
+    
     def __init__(self, title, description, control_widget, **kwargs):
-        super().__init__(orientation='vertical', **kwargs)
+        super().__init__(orientation='vertical', padding=_SETTING_ITEM_PADDING, **kwargs)
         self.size_hint_y = None
-        self.height = dp(80)
+        self.height = _SETTING_ITEM_HEIGHT
         
         # En-tête avec titre et description
-        header_layout = BoxLayout(orientation='horizontal', size_hint_y=0.6)
+        header_layout = BoxLayout(orientation='horizontal')
         
         info_layout = BoxLayout(orientation='vertical', size_hint_x=0.7)
         
         title_label = Label(
             text=title,
-            color=(0.83, 0.69, 0.22, 1),  # Doré
+            color=SettingItem._GOLD,
             font_size='14sp',
             bold=True,
             halign='left',
             size_hint_y=0.6,
-            text_size=(dp(150), None)
+            text_size=SettingItem._TEXT_SIZE
         )
         
         desc_label = Label(
             text=description,
-            color=(0.97, 0.96, 0.91, 0.7),  # Crème pâle
+            color=SettingItem._CREAM_DIM,
             font_size='10sp',
             halign='left',
             size_hint_y=0.4,
-            text_size=(dp(150), None)
+            text_size=SettingItem._TEXT_SIZE
         )
         
         info_layout.add_widget(title_label)
@@ -86,30 +215,29 @@ class SettingItem(BoxLayout):
         
         self.add_widget(header_layout)
         
-        # Ligne de séparation
-        separator = Label(size_hint_y=0.4)
-        self.add_widget(separator)
-        
         # Style
         self._setup_deco_style()
     
     def _setup_deco_style(self):
         """Style Art Déco"""
-        with self.canvas.before:
-            from kivy.graphics import Color, Line
-            
-            # Ligne décorative
-            Color(0.83, 0.69, 0.22, 0.3)
-            self.deco_line = Line(
-                points=[self.x + 20, self.y + 10, self.right - 20, self.y + 10],
-                width=1
-            )
+        # Ligne décorative, ajoutée au canvas en un seul groupe
+        self.deco_line = Line(
+            points=[self.x + 20, self.y + 10, self.right - 20, self.y + 10],
+            width=1
+        )
         
-        self.bind(pos=self._update_line)
+        self._deco_group = InstructionGroup()
+        self._deco_group.add(Color(*SettingItem._LINE_GOLD))
+        self._deco_group.add(self.deco_line)
+        self.canvas.before.add(self._deco_group)
+        
+        self.fbind('pos', self._update_line)
+        self.fbind('size', self._update_line)
     
     def _update_line(self, *args):
-        if hasattr(self, 'deco_line'):
-            self.deco_line.points = [self.x + 20, self.y + 10, self.right - 20, self.y + 10]
+        x, y = self.pos
+        line_y = y + 10
+        self.deco_line.points = [x + 20, line_y, x + self.width - 20, line_y]
 
 class PumpCalibrationItem(BoxLayout):
     """Item de calibration de pompe"""
@@ -119,17 +247,16 @@ class PumpCalibrationItem(BoxLayout):
         self.pump_data = pump_data
         self.callback = callback
         self.size_hint_y = None
-        self.height = dp(120)
+        self.height = _PUMP_ITEM_HEIGHT
+        
+        get = pump_data.get
+        ingredient = get('ingredient', 'N/A')
+        factor = get('calibration_factor', 1.0)
+        status = get('status', 'idle')
+        enabled = get('enabled', False)
         
         # Titre pompe
-        title_label = Label(
-            text=f"Pompe: {pump_data.get('ingredient', 'N/A')}",
-            color=(0.83, 0.69, 0.22, 1),
-            font_size='14sp',
-            bold=True,
-            size_hint_y=0.2,
-            halign='left'
-        )
+        title_label = _make_pump_title_label(text=f"Pompe: {ingredient}")
         
         # Facteur de calibration actuel
         cal_layout = BoxLayout(orientation='horizontal', size_hint_y=0.3)
@@ -140,23 +267,13 @@ class PumpCalibrationItem(BoxLayout):
             color=(0.97, 0.96, 0.91, 0.8)
         ))
         
-        self.cal_label = Label(
-            text=f"{pump_data.get('calibration_factor', 1.0):.3f}",
-            size_hint_x=0.6,
-            color=(0.83, 0.69, 0.22, 1),
-            bold=True
-        )
+        self.cal_label = _make_pump_factor_label(text=f"{factor:.3f}")
         cal_layout.add_widget(self.cal_label)
         
         # Contrôles de calibration
         controls_layout = BoxLayout(orientation='horizontal', size_hint_y=0.3)
         
-        self.volume_input = TextInput(
-            text='50',
-            size_hint_x=0.3,
-            multiline=False,
-            input_filter='float'
-        )
+        self.volume_input = _make_volume_input()
         
         cal_btn = Button(
             text='Calibrer',
@@ -176,13 +293,13 @@ class PumpCalibrationItem(BoxLayout):
         controls_layout.add_widget(test_btn)
         
         # Statut
-        self.status_label = Label(
-            text=pump_data.get('status', 'idle').upper(),
-            size_hint_y=0.2,
-            color=(0, 1, 0, 1) if pump_data.get('enabled') else (0.5, 0.5, 0.5, 1),
-            font_size='10sp'
+        self.status_label = _make_pump_status_label(
+            text=status.upper(),
+            color=(0, 1, 0, 1) if enabled else (0.5, 0.5, 0.5, 1)
         )
         
+        self._status_backup = None
+        
         self.add_widget(title_label)
         self.add_widget(cal_layout)
         self.add_widget(controls_layout)
@@ -193,45 +310,47 @@ class PumpCalibrationItem(BoxLayout):
     
     def _setup_deco_style(self):
         """Style Art Déco"""
-        with self.canvas.before:
-            from kivy.graphics import Color, RoundedRectangle, Line
-            
-            # Fond
-            Color(0.04, 0.04, 0.04, 0.5)
-            self.bg_rect = RoundedRectangle(
-                pos=self.pos,
-                size=self.size,
-                radius=[8]
-            )
-            
-            # Bordure
-            Color(0.83, 0.69, 0.22, 0.8)
-            self.border_line = Line(
-                rounded_rectangle=(self.x, self.y, self.width, self.height, 8),
-                width=1
-            )
+        # Fond
+        self.bg_rect = RoundedRectangle(
+            pos=self.pos,
+            size=self.size,
+            radius=[8]
+        )
         
-        self.bind(pos=self._update_graphics, size=self._update_graphics)
+        # Bordure
+        self.border_line = Line(
+            rounded_rectangle=(self.x, self.y, self.width, self.height, 8),
+            width=1
+        )
+        
+        # Fond et bordure ajoutés au canvas en un seul groupe
+        self._deco_group = InstructionGroup()
+        self._deco_group.add(Color(0.04, 0.04, 0.04, 0.5))
+        self._deco_group.add(self.bg_rect)
+        self._deco_group.add(Color(0.83, 0.69, 0.22, 0.8))
+        self._deco_group.add(self.border_line)
+        self.canvas.before.add(self._deco_group)
+        
+        self.fbind('pos', self._update_pos)
+        self.fbind('size', self._update_size)
     
-    def _update_graphics(self, *args):
-        if hasattr(self, 'bg_rect'):
-            self.bg_rect.pos = self.pos
-            self.bg_rect.size = self.size
-        if hasattr(self, 'border_line'):
-            self.border_line.rounded_rectangle = (self.x, self.y, self.width, self.height, 8)
+    def _update_pos(self, instance, pos):
+        self.bg_rect.pos = pos
+        self.border_line.rounded_rectangle = (pos[0], pos[1], self.width, self.height, 8)
+    
+    def _update_size(self, instance, size):
+        self.bg_rect.size = size
+        self.border_line.rounded_rectangle = (self.x, self.y, size[0], size[1], 8)
     
     def _calibrate(self, instance):
         """Lance la calibration"""
-        try:
-            volume = float(self.volume_input.text)
-            if volume <= 0 or volume > 500:
-                raise ValueError("Volume invalide")
-            
-            if self.callback:
-                self.callback('calibrate', self.pump_data, {'volume': volume})
-            
-        except ValueError:
+        volume = _parse_volume(self.volume_input.text)
+        if volume is None or volume <= 0 or volume > 500:
             self._show_error("Volume invalide (1-500ml)")
+            return
+        
+        if self.callback:
+            self.callback('calibrate', self.pump_data, {'volume': volume})
     
     def _test_pump(self, instance):
         """Test de la pompe"""
@@ -240,17 +359,20 @@ class PumpCalibrationItem(BoxLayout):
     
     def _show_error(self, message):
         """Affiche une erreur temporaire"""
-        original_text = self.status_label.text
-        original_color = self.status_label.color
+        # Garder le statut d'origine, pas une erreur déjà affichée
+        if self._status_backup is None:
+            self._status_backup = (self.status_label.text, tuple(self.status_label.color))
         
         self.status_label.text = message
         self.status_label.color = (1, 0, 0, 1)
         
-        def restore(*args):
-            self.status_label.text = original_text
-            self.status_label.color = original_color
-        
-        Clock.schedule_once(restore, 2.0)
+        Clock.unschedule(self._restore_status)
+        Clock.schedule_once(self._restore_status, 2.0)
+    
+    def _restore_status(self, dt):
+        """Rétablit le statut affiché avant l'erreur"""
+        self.status_label.text, self.status_label.color = self._status_backup
+        self._status_backup = None
     
     def update_calibration(self, new_factor):
         """Met à jour le facteur de calibration affiché"""
@@ -263,70 +385,77 @@ class PumpCalibrationItem(BoxLayout):
 class SettingsScreen(RoundScreen):
     """Écran de réglages du système"""
     
+    # Dernière lecture du fichier de réglages, partagée : (mtime, réglages fusionnés)
+    _settings_cache = None
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.name = 'settings'
+        self._settings_dirty = False
         self.settings_data = self._load_settings()
         
-        self._build_interface()
+        # Popups construits à la première utilisation puis réutilisés
+        self._cal_popup = None
+        self._reset_popup = None
+        self._status_popup = None
+        
+        # Dernier statut pompes lu : (horodatage monotonic, statut)
+        self._last_pump_status = None
+        
+        self._build_interface(animate_in=True)
     
     def _load_settings(self):
         """Charge les réglages depuis le fichier"""
-        default_settings = {
-            'system': {
-                'auto_clean': True,
-                'screen_brightness': 80,
-                'sound_enabled': True,
-                'demo_mode': False
-            },
-            'cocktails': {
-                'double_dose_multiplier': 2.0,
-                'preparation_timeout': 300,
-                'auto_garnish_reminder': True
-            },
-            'hardware': {
-                'pump_default_speed': 80,
-                'calibration_volume': 50,
-                'emergency_timeout': 10
-            }
-        }
-        
         try:
             settings_path = Path('config/settings.json')
             if settings_path.exists():
-                with open(settings_path, 'r', encoding='utf-8') as f:
-                    loaded_settings = json.load(f)
+                mtime = settings_path.stat().st_mtime
+                cache = SettingsScreen._settings_cache
+                
+                # Relire le fichier seulement s'il a changé depuis la dernière lecture
+                if cache is None or cache[0] != mtime:
+                    with open(settings_path, 'r', encoding='utf-8') as f:
+                        loaded_settings = json.load(f)
                     # Merger avec les défauts
-                    for category, values in default_settings.items():
-                        if category not in loaded_settings:
-                            loaded_settings[category] = values
-                        else:
-                            for key, default_value in values.items():
-                                if key not in loaded_settings[category]:
-                                    loaded_settings[category][key] = default_value
-                    return loaded_settings
+                    for category, values in _DEFAULT_SETTINGS.items():
+                        loaded_settings[category] = {**values, **loaded_settings.get(category, {})}
+                    cache = SettingsScreen._settings_cache = (mtime, loaded_settings)
+                
+                # Copie : les modifications non sauvegardées ne doivent pas toucher le cache
+                return copy.deepcopy(cache[1])
         except Exception as e:
             print(f"Erreur chargement réglages: {e}")
         
-        return default_settings
+        return copy.deepcopy(_DEFAULT_SETTINGS)
     
-    def _save_settings(self):
-        """Sauvegarde les réglages"""
+    def _save_settings(self, *args):
+        """Sauvegarde les réglages s'ils ont été modifiés"""
+        if not self._settings_dirty:
+            return
+        
         try:
             settings_path = Path('config/settings.json')
             settings_path.parent.mkdir(parents=True, exist_ok=True)
             
             with open(settings_path, 'w', encoding='utf-8') as f:
-                json.dump(self.settings_data, f, ensure_ascii=False, indent=2)
+                json.dump(self.settings_data, f, ensure_ascii=False, separators=(',', ':'))
             
+            self._settings_dirty = False
+            SettingsScreen._settings_cache = (
+                settings_path.stat().st_mtime,
+                copy.deepcopy(self.settings_data)
+            )
             print("✅ Réglages sauvegardés")
             
         except Exception as e:
             print(f"❌ Erreur sauvegarde réglages: {e}")
     
-    def _build_interface(self):
-        """Construit l'interface de réglages"""
-        main_layout = BoxLayout(orientation='vertical', spacing=dp(10), padding=dp(15))
+    def _build_interface(self, animate_in=True):
+        """Construit l'interface de réglages
+        
+        animate_in: joue le fondu doré d'entrée (inutile lors d'une reconstruction)
+        """
+        main_layout = BoxLayout(orientation='vertical', spacing=_SPACING, padding=_SPACING_LARGE)
         
         # Titre
         title_label = Label(
@@ -340,17 +469,21 @@ class SettingsScreen(RoundScreen):
         
         # Accordion pour catégories
         self.accordion = Accordion(orientation='vertical', size_hint_y=0.75)
+        self._panel_builders = {}
+        self._controls = {}
         
-        # Catégories de réglages
-        self._build_system_settings()
-        self._build_cocktail_settings()
-        self._build_hardware_settings()
+        # Catégories de réglages, construites à la première ouverture. La
+        # première est ouverte d'office : sinon l'Accordion ouvre la dernière
+        # ajoutée (hardware) et construirait la liste des pompes dès l'entrée
+        for index, (category, title, fields) in enumerate(_SETTINGS_SCHEMA):
+            builder = self._build_hardware_settings if category == 'hardware' else self._build_panel
+            self._add_lazy_panel(title, partial(builder, category, fields), collapse=index > 0)
         
         # Boutons de navigation
         nav_layout = BoxLayout(
             orientation='horizontal',
             size_hint_y=0.15,
-            spacing=dp(15)
+            spacing=_SPACING_LARGE
         )
         
         # Bouton Retour
@@ -365,7 +498,7 @@ class SettingsScreen(RoundScreen):
             text='💾 SAUVEGARDER',
             size_hint_x=0.4
         )
-        save_btn.bind(on_press=lambda x: self._save_settings())
+        save_btn.bind(on_press=self._save_settings)
         
         # Bouton Reset
         reset_btn = Button(
@@ -387,142 +520,62 @@ class SettingsScreen(RoundScreen):
         self.add_widget(main_layout)
         
         # Animation d'entrée
-        DecoTransition.fade_in_gold(main_layout, 0.8)
+        if animate_in:
+            DecoTransition.fade_in_gold(main_layout, 0.8)
     
-    def _build_system_settings(self):
-        """Construit les réglages système"""
-        content = BoxLayout(orientation='vertical', spacing=dp(5))
-        
-        # Nettoyage automatique
-        auto_clean_switch = Switch()
-        auto_clean_switch.active = self.settings_data['system']['auto_clean']
-        auto_clean_switch.bind(active=lambda x, v: self._update_setting('system', 'auto_clean', v))
-        
-        content.add_widget(SettingItem(
-            'Nettoyage automatique',
-            'Nettoyage des pompes après chaque cocktail',
-            auto_clean_switch
-        ))
-        
-        # Luminosité écran
-        brightness_slider = Slider(
-            min=20, max=100, value=self.settings_data['system']['screen_brightness'],
-            step=10
-        )
-        brightness_slider.bind(value=lambda x, v: self._update_setting('system', 'screen_brightness', int(v)))
-        
-        content.add_widget(SettingItem(
-            'Luminosité écran',
-            'Réglage de la luminosité (20-100%)',
-            brightness_slider
-        ))
-        
-        # Son activé
-        sound_switch = Switch()
-        sound_switch.active = self.settings_data['system']['sound_enabled']
-        sound_switch.bind(active=lambda x, v: self._update_setting('system', 'sound_enabled', v))
-        
-        content.add_widget(SettingItem(
-            'Sons système',
-            'Activer les sons et notifications',
-            sound_switch
-        ))
-        
-        # Mode démo
-        demo_switch = Switch()
-        demo_switch.active = self.settings_data['system']['demo_mode']
-        demo_switch.bind(active=lambda x, v: self._update_setting('system', 'demo_mode', v))
-        
-        content.add_widget(SettingItem(
-            'Mode démonstration',
-            'Simulation sans hardware réel',
-            demo_switch
-        ))
-        
-        # Créer l'item accordion
-        system_item = AccordionItem(title='🔧 Système')
-        system_item.add_widget(content)
-        self.accordion.add_widget(system_item)
+    def _add_lazy_panel(self, title, builder, collapse=True):
+        """Ajoute une catégorie dont le contenu n'est construit qu'à l'ouverture"""
+        item = AccordionItem(title=title, collapse=collapse)
+        self._panel_builders[item] = builder
+        item.fbind('collapse', self._on_accordion_collapse)
+        self.accordion.add_widget(item)
+        if not collapse:
+            # Ouverte dès la création : aucun changement de collapse à observer
+            self._on_accordion_collapse(item, False)
     
-    def _build_cocktail_settings(self):
-        """Construit les réglages cocktails"""
-        content = BoxLayout(orientation='vertical', spacing=dp(5))
-        
-        # Multiplicateur double dose
-        double_dose_slider = Slider(
-            min=1.5, max=3.0, value=self.settings_data['cocktails']['double_dose_multiplier'],
-            step=0.1
-        )
-        double_dose_slider.bind(value=lambda x, v: self._update_setting('cocktails', 'double_dose_multiplier', round(v, 1)))
-        
-        content.add_widget(SettingItem(
-            'Multiplicateur double dose',
-            'Facteur pour les doubles doses (1.5-3.0x)',
-            double_dose_slider
-        ))
-        
-        # Timeout préparation
-        timeout_slider = Slider(
-            min=60, max=600, value=self.settings_data['cocktails']['preparation_timeout'],
-            step=30
-        )
-        timeout_slider.bind(value=lambda x, v: self._update_setting('cocktails', 'preparation_timeout', int(v)))
-        
-        content.add_widget(SettingItem(
-            'Timeout préparation',
-            'Temps limite pour préparer (60-600s)',
-            timeout_slider
-        ))
-        
-        # Rappel garnitures
-        garnish_switch = Switch()
-        garnish_switch.active = self.settings_data['cocktails']['auto_garnish_reminder']
-        garnish_switch.bind(active=lambda x, v: self._update_setting('cocktails', 'auto_garnish_reminder', v))
+    def _on_accordion_collapse(self, item, collapse):
+        """Construit le contenu d'une catégorie lors de sa première ouverture"""
+        if collapse:
+            return
+        builder = self._panel_builders.pop(item, None)
+        if builder is not None:
+            # Le contenu est entièrement rempli hors de l'arbre avant d'être
+            # attaché : une seule passe de layout à l'ouverture du panneau
+            item.add_widget(builder())
+    
+    def _build_setting_item(self, category, key, control, title, description):
+        """Construit un SettingItem et son contrôle d'après le schéma"""
+        value = self.settings_data[category][key]
         
-        content.add_widget(SettingItem(
-            'Rappel garnitures',
-            'Rappel automatique pour les garnitures',
-            garnish_switch
-        ))
+        if control[0] == 'switch':
+            widget = Switch(active=value)
+            widget.fbind('active', self._update_setting_bool, category, key)
+        else:
+            _, min_value, max_value, step, conversion = control
+            widget = Slider(min=min_value, max=max_value, value=value, step=step)
+            handler = self._update_setting_int if conversion == 'int' else self._update_setting_rounded
+            widget.fbind('value', handler, category, key)
         
-        cocktails_item = AccordionItem(title='🍸 Cocktails')
-        cocktails_item.add_widget(content)
-        self.accordion.add_widget(cocktails_item)
+        self._controls[(category, key)] = widget
+        return SettingItem(title, description, widget)
     
-    def _build_hardware_settings(self):
-        """Construit les réglages hardware"""
+    def _build_panel(self, category, fields):
+        """Construit le contenu d'une catégorie de réglages"""
+        content = BoxLayout(orientation='vertical', spacing=_SPACING_SMALL)
+        for field in fields:
+            content.add_widget(self._build_setting_item(category, *field))
+        return content
+    
+    def _build_hardware_settings(self, category, fields):
+        """Construit le contenu des réglages hardware"""
         content = ScrollView()
-        content_layout = BoxLayout(orientation='vertical', size_hint_y=None, spacing=dp(10))
+        content_layout = BoxLayout(orientation='vertical', size_hint_y=None, spacing=_SPACING)
         content_layout.bind(minimum_height=content_layout.setter('height'))
         
         # Réglages généraux hardware
-        general_layout = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(160))
-        
-        # Vitesse par défaut des pompes
-        pump_speed_slider = Slider(
-            min=40, max=100, value=self.settings_data['hardware']['pump_default_speed'],
-            step=10
-        )
-        pump_speed_slider.bind(value=lambda x, v: self._update_setting('hardware', 'pump_default_speed', int(v)))
-        
-        general_layout.add_widget(SettingItem(
-            'Vitesse pompes',
-            'Vitesse par défaut des pompes (40-100%)',
-            pump_speed_slider
-        ))
-        
-        # Timeout d'urgence
-        emergency_slider = Slider(
-            min=5, max=30, value=self.settings_data['hardware']['emergency_timeout'],
-            step=5
-        )
-        emergency_slider.bind(value=lambda x, v: self._update_setting('hardware', 'emergency_timeout', int(v)))
-        
-        general_layout.add_widget(SettingItem(
-            'Timeout d\'urgence',
-            'Délai d\'arrêt d\'urgence (5-30s)',
-            emergency_slider
-        ))
+        general_layout = BoxLayout(orientation='vertical', size_hint_y=None, height=_HARDWARE_GENERAL_HEIGHT)
+        for field in fields:
+            general_layout.add_widget(self._build_setting_item(category, *field))
         
         content_layout.add_widget(general_layout)
         
@@ -533,7 +586,7 @@ class SettingsScreen(RoundScreen):
             font_size='14sp',
             bold=True,
             size_hint_y=None,
-            height=dp(40),
+            height=_ROW_HEIGHT,
             halign='center'
         )
         content_layout.add_widget(pumps_title)
@@ -543,16 +596,13 @@ class SettingsScreen(RoundScreen):
         
         content.add_widget(content_layout)
         
-        hardware_item = AccordionItem(title='⚡ Hardware')
-        hardware_item.add_widget(content)
-        self.accordion.add_widget(hardware_item)
+        return content
     
     def _build_pump_calibration(self, parent_layout):
         """Construit la section de calibration des pompes"""
         if PUMP_SUPPORT:
             try:
-                manager = get_pump_manager()
-                status = manager.get_system_status()
+                status = self._get_pump_status()
                 
                 for pump_status in status.get('pumps', []):
                     if pump_status.get('enabled', False):
@@ -567,24 +617,29 @@ class SettingsScreen(RoundScreen):
                     text=f"Erreur chargement pompes: {str(e)[:50]}",
                     color=(1, 0, 0, 1),
                     size_hint_y=None,
-                    height=dp(40)
+                    height=_ROW_HEIGHT
                 )
                 parent_layout.add_widget(error_label)
         else:
             # Mode démo
-            demo_pumps = [
-                {'id': 'pump_1', 'ingredient': 'Gin', 'calibration_factor': 1.0, 'enabled': True, 'status': 'idle'},
-                {'id': 'pump_2', 'ingredient': 'Vodka', 'calibration_factor': 0.95, 'enabled': True, 'status': 'idle'},
-                {'id': 'pump_7', 'ingredient': 'Sprite', 'calibration_factor': 1.1, 'enabled': True, 'status': 'idle'}
-            ]
-            
-            for pump_data in demo_pumps:
+            for pump_data in _DEMO_PUMPS:
                 pump_cal = PumpCalibrationItem(
                     pump_data,
                     callback=self._on_pump_action
                 )
                 parent_layout.add_widget(pump_cal)
     
+    def _get_pump_status(self):
+        """Statut système des pompes, réutilisé s'il date de moins d'une seconde"""
+        now = time.monotonic()
+        cached = self._last_pump_status
+        if cached is not None and now - cached[0] < _PUMP_STATUS_TTL:
+            return cached[1]
+        
+        status = get_pump_manager().get_system_status()
+        self._last_pump_status = (now, status)
+        return status
+    
     def _on_pump_action(self, action, pump_data, params):
         """Callback pour actions sur les pompes"""
         pump_id = pump_data.get('id')
@@ -613,7 +668,24 @@ class SettingsScreen(RoundScreen):
     
     def _show_calibration_dialog(self, pump_data, volume):
         """Affiche le dialogue de calibration"""
-        content = BoxLayout(orientation='vertical', spacing=dp(15))
+        if self._cal_popup is None:
+            self._build_calibration_dialog()
+        
+        self._cal_pump_data = pump_data
+        self._cal_volume = volume
+        
+        # Réinitialiser le dialogue pour cette pompe
+        Clock.unschedule(self._on_calibration_poured)
+        self._cal_popup.title = f'Calibration {pump_data["ingredient"]}'
+        self._cal_pour_btn.text = f'Démarrer versement {volume}ml'
+        self._cal_pour_btn.disabled = False
+        self._cal_measure_input.text = ''
+        
+        self._cal_popup.open()
+    
+    def _build_calibration_dialog(self):
+        """Construit une fois le dialogue de calibration, réutilisé ensuite"""
+        content = BoxLayout(orientation='vertical', spacing=_SPACING_LARGE)
         
         # Instructions
         instructions = Label(
@@ -622,33 +694,32 @@ class SettingsScreen(RoundScreen):
                  f"3. Mesurez le volume obtenu\n"
                  f"4. Entrez la mesure ci-dessous",
             halign='center',
-            text_size=(dp(250), None)
+            text_size=(_DIALOG_TEXT_WIDTH, None)
         )
         content.add_widget(instructions)
         
         # Bouton de versement
-        pour_btn = Button(
-            text=f'Démarrer versement {volume}ml',
+        self._cal_pour_btn = Button(
             size_hint_y=None,
-            height=dp(50)
+            height=_BUTTON_HEIGHT
         )
-        content.add_widget(pour_btn)
+        content.add_widget(self._cal_pour_btn)
         
         # Champ de mesure
-        measure_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(40))
+        measure_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=_ROW_HEIGHT)
         measure_layout.add_widget(Label(text='Volume mesuré:', size_hint_x=0.6))
         
-        measure_input = TextInput(
+        self._cal_measure_input = TextInput(
             text='',
             multiline=False,
             input_filter='float',
             size_hint_x=0.4
         )
-        measure_layout.add_widget(measure_input)
+        measure_layout.add_widget(self._cal_measure_input)
         content.add_widget(measure_layout)
         
         # Boutons
-        buttons_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(50))
+        buttons_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=_BUTTON_HEIGHT)
         
         cancel_btn = Button(text='Annuler', size_hint_x=0.33)
         apply_btn = Button(text='Appliquer', size_hint_x=0.33)
@@ -660,42 +731,48 @@ class SettingsScreen(RoundScreen):
         
         content.add_widget(buttons_layout)
         
-        popup = Popup(
-            title=f'Calibration {pump_data["ingredient"]}',
+        self._cal_popup = Popup(
             content=content,
             size_hint=(0.9, 0.8),
             auto_dismiss=False
         )
         
-        def on_pour(*args):
-            pour_btn.text = 'Versement en cours...'
-            pour_btn.disabled = True
-            # En mode réel, lancerait le versement
-            Clock.schedule_once(lambda dt: (
-                setattr(pour_btn, 'text', 'Versement terminé'),
-                setattr(pour_btn, 'disabled', False)
-            ), 3.0)
-        
-        def on_apply(*args):
-            try:
-                measured = float(measure_input.text)
-                if 1 <= measured <= 500:
-                    # Calculer nouveau facteur
-                    new_factor = volume / measured
-                    print(f"✅ Nouvelle calibration: {new_factor:.3f}")
-                    # En mode réel, appliquerait la calibration
-                    popup.dismiss()
-                else:
-                    measure_input.text = 'Valeur invalide'
-            except ValueError:
-                measure_input.text = 'Nombre requis'
-        
-        pour_btn.bind(on_press=on_pour)
-        cancel_btn.bind(on_press=popup.dismiss)
-        apply_btn.bind(on_press=on_apply)
-        test_btn.bind(on_press=lambda x: self._test_pump(pump_data, 10))
-        
-        popup.open()
+        self._cal_pour_btn.bind(on_press=self._on_calibration_pour)
+        cancel_btn.bind(on_press=self._cal_popup.dismiss)
+        apply_btn.bind(on_press=self._on_calibration_apply)
+        test_btn.bind(on_press=self._on_calibration_test)
+    
+    def _on_calibration_pour(self, instance):
+        """Lance le versement de calibration"""
+        pour_btn = self._cal_pour_btn
+        pour_btn.text = 'Versement en cours...'
+        pour_btn.disabled = True
+        # En mode réel, lancerait le versement
+        Clock.schedule_once(self._on_calibration_poured, 3.0)
+    
+    def _on_calibration_poured(self, dt):
+        """Fin du versement de calibration"""
+        self._cal_pour_btn.text = 'Versement terminé'
+        self._cal_pour_btn.disabled = False
+    
+    def _on_calibration_apply(self, instance):
+        """Calcule et applique le nouveau facteur de calibration"""
+        measure_input = self._cal_measure_input
+        measured = _parse_volume(measure_input.text)
+        if measured is None:
+            measure_input.text = 'Nombre requis'
+        elif 1 <= measured <= 500:
+            # Calculer nouveau facteur
+            new_factor = self._cal_volume / measured
+            print(f"✅ Nouvelle calibration: {new_factor:.3f}")
+            # En mode réel, appliquerait la calibration
+            self._cal_popup.dismiss()
+        else:
+            measure_input.text = 'Valeur invalide'
+    
+    def _on_calibration_test(self, instance):
+        """Test 10ml depuis le dialogue de calibration"""
+        self._test_pump(self._cal_pump_data, 10)
     
     def _test_pump(self, pump_data, volume):
         """Test une pompe"""
@@ -712,27 +789,55 @@ class SettingsScreen(RoundScreen):
         self._show_status_message(f"Test {pump_data['ingredient']} terminé")
     
     def _update_setting(self, category, key, value):
-        """Met à jour un réglage"""
-        if category not in self.settings_data:
-            self.settings_data[category] = {}
+        """Met à jour un réglage (appelé à chaque pas de slider : rester léger)"""
+        values = self.settings_data.setdefault(category, {})
+        if values.get(key) == value:
+            return
         
-        self.settings_data[category][key] = value
-        print(f"⚙️ Réglage: {category}.{key} = {value}")
+        values[key] = value
+        self._settings_dirty = True
+    
+    # Callbacks fbind: les arguments positionnels liés précèdent (instance, valeur)
+    def _update_setting_bool(self, category, key, instance, value):
+        self._update_setting(category, key, bool(value))
+    
+    def _update_setting_int(self, category, key, instance, value):
+        self._update_setting(category, key, int(value))
+    
+    def _update_setting_rounded(self, category, key, instance, value):
+        self._update_setting(category, key, round(value, 1))
     
     def _show_status_message(self, message):
         """Affiche un message de statut temporaire"""
-        popup = Popup(
-            title='Information',
-            content=Label(text=message, halign='center'),
-            size_hint=(0.6, 0.4),
-            auto_dismiss=True
-        )
-        popup.open()
-        Clock.schedule_once(lambda dt: popup.dismiss(), 2.0)
+        if self._status_popup is None:
+            self._status_label = Label(halign='center')
+            self._status_popup = Popup(
+                title='Information',
+                content=self._status_label,
+                size_hint=(0.6, 0.4),
+                auto_dismiss=True
+            )
+        
+        self._status_label.text = message
+        self._status_popup.open()
+        
+        # Un nouveau message repart pour 2 secondes complètes
+        Clock.unschedule(self._dismiss_status)
+        Clock.schedule_once(self._dismiss_status, 2.0)
+    
+    def _dismiss_status(self, dt):
+        """Ferme le message de statut"""
+        self._status_popup.dismiss()
     
     def _show_reset_confirmation(self, instance):
         """Confirme la remise à zéro"""
-        content = BoxLayout(orientation='vertical', spacing=dp(15))
+        if self._reset_popup is None:
+            self._build_reset_confirmation()
+        self._reset_popup.open()
+    
+    def _build_reset_confirmation(self):
+        """Construit une fois la confirmation de remise à zéro"""
+        content = BoxLayout(orientation='vertical', spacing=_SPACING_LARGE)
         
         content.add_widget(Label(
             text='⚠️ ATTENTION ⚠️\n\nCeci va remettre tous les réglages\naux valeurs par défaut.\n\nÊtes-vous sûr?',
@@ -753,30 +858,36 @@ class SettingsScreen(RoundScreen):
         buttons_layout.add_widget(confirm_btn)
         content.add_widget(buttons_layout)
         
-        popup = Popup(
+        self._reset_popup = Popup(
             title='Confirmation Reset',
             content=content,
             size_hint=(0.8, 0.7),
             auto_dismiss=False
         )
         
-        def on_confirm(*args):
-            self._reset_settings()
-            popup.dismiss()
-        
-        cancel_btn.bind(on_press=popup.dismiss)
-        confirm_btn.bind(on_press=on_confirm)
-        
-        popup.open()
+        cancel_btn.bind(on_press=self._reset_popup.dismiss)
+        confirm_btn.bind(on_press=self._on_reset_confirmed)
+    
+    def _on_reset_confirmed(self, instance):
+        """Remise à zéro confirmée"""
+        self._reset_settings()
+        self._reset_popup.dismiss()
     
     def _reset_settings(self):
         """Remet les réglages à zéro"""
-        # Recharger les défauts
-        self.settings_data = self._load_settings()
+        # Revenir aux défauts, sans relire le fichier
+        self.settings_data = copy.deepcopy(_DEFAULT_SETTINGS)
+        self._settings_dirty = True
+        self._save_settings()
         
-        # Reconstruire l'interface
-        self.clear_widgets()
-        self._build_interface()
+        # Mettre à jour les contrôles déjà construits ; les panneaux pas
+        # encore ouverts liront les défauts à leur construction
+        for (category, key), control in self._controls.items():
+            value = self.settings_data[category][key]
+            if isinstance(control, Switch):
+                control.active = value
+            else:
+                control.value = value
         
         print("🔄 Réglages remis aux valeurs par défaut")
         self._show_status_message("Réglages remis à zéro")
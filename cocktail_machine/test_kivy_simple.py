@@ -11,16 +11,15 @@ from kivy.uix.label import Label
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
 from kivy.graphics import Color, Line
-from kivy.core.window import Window
 from kivy.config import Config
 
-# Configuration AVANT les imports Kivy
-Config.set('graphics', 'width', '480')
-Config.set('graphics', 'height', '480')
-Config.set('graphics', 'resizable', '1')
 
-print("🍸 Test Kivy - Diagnostic...")
-print(f"Window disponible: {Window is not None}")
+def _configure():
+    """Configuration de la fenêtre, AVANT la création de Window"""
+    Config.set('graphics', 'width', '480')
+    Config.set('graphics', 'height', '480')
+    Config.set('graphics', 'resizable', '1')
+
 
 class TestWidget(BoxLayout):
     def __init__(self, **kwargs):
@@ -67,6 +66,14 @@ class TestApp(App):
         return TestWidget()
 
 if __name__ == '__main__':
+    _configure()
+    
+    # Import après la configuration : il crée la fenêtre
+    from kivy.core.window import Window
+    
+    print("🍸 Test Kivy - Diagnostic...")
+    print(f"Window disponible: {Window is not None}")
+    
     try:
         print("Démarrage test Kivy...")
         app = TestApp()
@@ -8,13 +8,18 @@ from kivy.app import App
 from kivy.uix.label import Label
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
-from kivy.graphics import Color, Ellipse, Line
+from kivy.graphics import Color, Ellipse, Line, InstructionGroup
 from kivy.metrics import dp
 
 # Configuration Kivy
 from kivy.config import Config
-Config.set('graphics', 'width', '480')
-Config.set('graphics', 'height', '480')
+
+
+def _configure():
+    """Taille de fenêtre de l'écran rond, appliquée au lancement seulement"""
+    Config.set('graphics', 'width', '480')
+    Config.set('graphics', 'height', '480')
+
 
 class ArtDecoWidget(BoxLayout):
     """Widget simple Art Déco pour test"""
@@ -59,21 +64,24 @@ class ArtDecoWidget(BoxLayout):
     
     def _setup_deco_graphics(self):
         """Ajoute les motifs Art Déco"""
-        with self.canvas.after:
-            # Bordure dorée
-            Color(0.83, 0.69, 0.22, 0.8)
-            Line(rectangle=(self.x + 10, self.y + 10, 
-                          self.width - 20, self.height - 20), width=3)
+        # Bordure dorée, ajoutée une seule fois au canvas
+        # (coins en onglet : angles nets et moins de sommets que 'round')
+        self._border = Line(rectangle=(self.x + 10, self.y + 10, 
+                                       self.width - 20, self.height - 20),
+                            width=3, joint='miter')
+        
+        self._deco_group = InstructionGroup()
+        self._deco_group.add(Color(0.83, 0.69, 0.22, 0.8))
+        self._deco_group.add(self._border)
+        self.canvas.after.add(self._deco_group)
         
         self.bind(pos=self._update_graphics, size=self._update_graphics)
     
     def _update_graphics(self, *args):
         """Met à jour les graphiques"""
-        self.canvas.after.clear()
-        with self.canvas.after:
-            Color(0.83, 0.69, 0.22, 0.8)
-            Line(rectangle=(self.x + 10, self.y + 10, 
-                          self.width - 20, self.height - 20), width=3)
+        # Modifier la bordure existante plutôt que vider et redessiner le canvas
+        self._border.rectangle = (self.x + 10, self.y + 10,
+                                  self.width - 20, self.height - 20)
     
     def on_button_press(self, instance):
         """Action du bouton"""
@@ -88,6 +96,7 @@ class TestApp(App):
         return ArtDecoWidget()
 
 if __name__ == '__main__':
+    _configure()
     print("🍸 Test de l'interface Kivy Art Déco...")
     try:
         app = TestApp()
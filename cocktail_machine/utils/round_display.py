@@ -7,12 +7,56 @@ Gestion du masque circulaire et des zones de sécurité
 
 from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.widget import Widget
-from kivy.graphics import Ellipse, Color, Line, PushMatrix, PopMatrix, Rotate
+from kivy.graphics import Ellipse, Color, Rectangle, Mesh, PushMatrix, PopMatrix, Scale
 from kivy.graphics.instructions import InstructionGroup
-from kivy.metrics import dp
 from kivy.animation import Animation
 from kivy.clock import Clock
 import math
+from math import sqrt as _sqrt
+from functools import lru_cache
+
+
+# Nombre de segments du cercle intérieur du masque
+_MASK_SEGMENTS = 64
+_MASK_ANGLES = tuple(2 * math.pi * i / _MASK_SEGMENTS for i in range(_MASK_SEGMENTS))
+# Bande fermée : segments + 4 coins + retour au départ, 2 sommets par angle
+_MASK_INDICES = list(range(2 * (_MASK_SEGMENTS + 5)))
+
+
+@lru_cache(maxsize=8)
+def _mask_vertices(x, y, width, height):
+    """Sommets (x, y, u, v) de la bande « rectangle moins cercle inscrit »
+    
+    Chaque angle relie un point du cercle au point du bord du rectangle
+    dans la même direction. Les angles des quatre coins sont ajoutés pour
+    que chaque quadrilatère de la bande s'appuie sur un seul côté.
+    
+    Mémoïsée : sur l'écran de production (résolution fixe), la géométrie
+    n'est calculée qu'une fois. Le tuple retourné est partagé.
+    """
+    half_w = width / 2
+    half_h = height / 2
+    center_x = x + half_w
+    center_y = y + half_h
+    radius = min(half_w, half_h)
+    
+    corner = math.atan2(half_h, half_w)
+    angles = sorted(_MASK_ANGLES + (corner, math.pi - corner, math.pi + corner, 2 * math.pi - corner))
+    angles.append(angles[0])
+    
+    vertices = []
+    for angle in angles:
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        # Distance du centre au bord du rectangle dans cette direction
+        reach_x = half_w / abs(cos_a) if cos_a else math.inf
+        reach_y = half_h / abs(sin_a) if sin_a else math.inf
+        reach = min(reach_x, reach_y)
+        vertices.extend((
+            center_x + reach * cos_a, center_y + reach * sin_a, 0, 0,
+            center_x + radius * cos_a, center_y + radius * sin_a, 0, 0,
+        ))
+    return tuple(vertices)
 
 
 class CircularMask(Widget):
@@ -20,25 +64,43 @@ class CircularMask(Widget):
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.bind(size=self._update_mask, pos=self._update_mask)
+        
+        # Les coins hors du cercle inscrit, en un seul Mesh : un seul appel de dessin
+        with self.canvas:
+            Color(0.04, 0.04, 0.04, 1)  # Noir pour cacher les bords
+            self._mask_mesh = Mesh(mode='triangle_strip')
+        
+        # pos et size changent souvent ensemble : un seul recalcul avant la frame
+        self._update_trigger = Clock.create_trigger(self._update_mask, -1)
+        self.bind(size=self._update_trigger, pos=self._update_trigger)
     
     def _update_mask(self, *args):
-        self.canvas.clear()
-        if self.size[0] > 0 and self.size[1] > 0:
-            diameter = min(self.size)
-            with self.canvas:
-                Color(0.04, 0.04, 0.04, 1)  # Noir pour cacher les bords
-                # Rectangles pour masquer les coins
-                from kivy.graphics import Rectangle
-                
-                # Haut
-                Rectangle(pos=(0, diameter), size=(self.width, self.height - diameter))
-                # Bas  
-                Rectangle(pos=(0, 0), size=(self.width, self.height - diameter))
-                # Gauche
-                Rectangle(pos=(0, 0), size=(self.width - diameter, self.height))
-                # Droite
-                Rectangle(pos=(diameter, 0), size=(self.width - diameter, self.height))
+        width, height = self.size
+        if width <= 0 or height <= 0:
+            return
+        
+        x, y = self.pos
+        vertices = _mask_vertices(x, y, width, height)
+        self._mask_mesh.vertices = list(vertices)
+        self._mask_mesh.indices = _MASK_INDICES
+
+
+def _clamp_to_circle(center_x, center_y, widget_x, widget_y, widget_extent, radius):
+    """Centre ramené dans le cercle, ou None si le widget y tient déjà
+    
+    Ne travaille que sur des floats : aucun accès aux propriétés Kivy.
+    """
+    # Écart au centre
+    dx = widget_x - center_x
+    dy = widget_y - center_y
+    distance_sq = dx * dx + dy * dy
+    
+    # La racine n'est calculée que si le widget dépasse
+    max_distance = radius - widget_extent / 2
+    if max_distance > 0 and distance_sq > max_distance * max_distance:
+        ratio = max_distance / _sqrt(distance_sq)
+        return center_x + dx * ratio, center_y + dy * ratio
+    return None
 
 
 class CircleLayout(FloatLayout):
@@ -48,12 +110,19 @@ class CircleLayout(FloatLayout):
         super().__init__(**kwargs)
         self.safe_margin = safe_margin  # Marge de sécurité (10% du rayon)
         self.circle_radius = 0
+        
+        # Widgets contraints au cercle, recalculés ensemble une fois par frame
+        self._constrained = []
+        self._constrain_trigger = Clock.create_trigger(self._constrain_all, 0)
+        
         self.bind(size=self._update_circle_bounds)
+        self.bind(pos=self._constrain_trigger, size=self._constrain_trigger)
     
     def _update_circle_bounds(self, *args):
         """Met à jour les dimensions du cercle utilisable"""
-        if self.size[0] > 0 and self.size[1] > 0:
-            diameter = min(self.size)
+        width, height = self.size
+        if width > 0 and height > 0:
+            diameter = width if width < height else height
             self.circle_radius = (diameter / 2) * (1 - self.safe_margin)
     
     def add_widget(self, widget, **kwargs):
@@ -61,32 +130,36 @@ class CircleLayout(FloatLayout):
         super().add_widget(widget, **kwargs)
         self._constrain_to_circle(widget)
     
+    def remove_widget(self, widget, **kwargs):
+        """Retire un widget et cesse de le contraindre"""
+        super().remove_widget(widget, **kwargs)
+        if widget in self._constrained:
+            self._constrained.remove(widget)
+            widget.unbind(pos=self._constrain_trigger, size=self._constrain_trigger)
+    
     def _constrain_to_circle(self, widget):
         """Contraint un widget à rester dans les limites du cercle"""
         if hasattr(widget, 'size_hint') and widget.size_hint != (None, None):
             return  # Les widgets avec size_hint sont gérés automatiquement
         
-        def update_position(*args):
-            if self.circle_radius <= 0:
-                return
-            
-            center_x = self.center_x
-            center_y = self.center_y
-            
-            # Distance du centre
-            widget_center_x = widget.center_x
-            widget_center_y = widget.center_y
-            distance = math.sqrt((widget_center_x - center_x)**2 + (widget_center_y - center_y)**2)
-            
-            # Si le widget dépasse, le ramener dans le cercle
-            max_distance = self.circle_radius - max(widget.width, widget.height) / 2
-            if distance > max_distance and max_distance > 0:
-                ratio = max_distance / distance
-                widget.center_x = center_x + (widget_center_x - center_x) * ratio
-                widget.center_y = center_y + (widget_center_y - center_y) * ratio
-        
-        widget.bind(pos=update_position, size=update_position)
-        self.bind(pos=update_position, size=update_position)
+        self._constrained.append(widget)
+        widget.bind(pos=self._constrain_trigger, size=self._constrain_trigger)
+        self._constrain_trigger()
+    
+    def _constrain_all(self, *args):
+        """Ramène dans le cercle tous les widgets contraints qui en dépassent"""
+        radius = self.circle_radius
+        if radius <= 0:
+            return
+        
+        center_x, center_y = self.center
+        clamp = _clamp_to_circle
+        for widget in self._constrained:
+            # Une lecture de center et de size par widget
+            widget_x, widget_y = widget.center
+            new_center = clamp(center_x, center_y, widget_x, widget_y, max(widget.size), radius)
+            if new_center is not None:
+                widget.center = new_center
 
 
 class RoundScreen(CircleLayout):
@@ -95,46 +168,57 @@ class RoundScreen(CircleLayout):
     def __init__(self, **kwargs):
         super().__init__(safe_margin=0.15, **kwargs)
         self._setup_background()
-        self._setup_animations()
     
     def _setup_background(self):
         """Configure le fond Art Déco"""
-        with self.canvas.before:
-            # Fond noir profond
-            Color(0.04, 0.04, 0.04, 1)
-            self.bg_rect = Rectangle(pos=self.pos, size=self.size)
-            
-            # Cercle de base doré
-            Color(0.83, 0.69, 0.22, 0.3)
-            diameter = min(self.size) if self.size[0] > 0 else 400
-            self.circle = Ellipse(
-                pos=(self.center_x - diameter/2, self.center_y - diameter/2),
-                size=(diameter, diameter)
-            )
-        
-        self.bind(size=self._update_background, pos=self._update_background)
+        # Géométrie du cercle précalculée pour la résolution de l'écran cible
+        resolution = tuple(ROUND_SCREEN_CONFIG['resolution'])
+        static_diameter = min(resolution) * 0.95
+        self._static_size = resolution
+        self._static_circle_offset = (
+            (resolution[0] - static_diameter) / 2,
+            (resolution[1] - static_diameter) / 2
+        )
+        self._static_circle_size = (static_diameter, static_diameter)
+        
+        # Fond noir profond
+        self.bg_rect = Rectangle(pos=self.pos, size=self.size)
+        
+        # Cercle de base doré
+        diameter = min(self.size) if self.size[0] > 0 else static_diameter
+        self.circle = Ellipse(
+            pos=(self.center_x - diameter/2, self.center_y - diameter/2),
+            size=(diameter, diameter)
+        )
+        
+        # Ajoutés une seule fois au canvas, puis seulement modifiés sur place
+        self._background_group = InstructionGroup()
+        self._background_group.add(Color(0.04, 0.04, 0.04, 1))
+        self._background_group.add(self.bg_rect)
+        self._background_group.add(Color(0.83, 0.69, 0.22, 0.3))
+        self._background_group.add(self.circle)
+        self.canvas.before.add(self._background_group)
+        
+        # pos et size changent souvent ensemble : un seul recalcul avant la frame
+        self._background_trigger = Clock.create_trigger(self._update_background, -1)
+        self.bind(size=self._background_trigger, pos=self._background_trigger)
     
     def _update_background(self, *args):
         """Met à jour le fond quand la taille change"""
-        if hasattr(self, 'bg_rect'):
-            self.bg_rect.pos = self.pos
-            self.bg_rect.size = self.size
+        x, y = self.pos
+        width, height = self.size
+        self.bg_rect.pos = (x, y)
+        self.bg_rect.size = (width, height)
         
-        if hasattr(self, 'circle') and self.size[0] > 0:
-            diameter = min(self.size) * 0.95
-            self.circle.pos = (self.center_x - diameter/2, self.center_y - diameter/2)
+        if (width, height) == self._static_size:
+            # Cas de l'écran rond de production : géométrie déjà connue
+            offset_x, offset_y = self._static_circle_offset
+            self.circle.pos = (x + offset_x, y + offset_y)
+            self.circle.size = self._static_circle_size
+        elif width > 0:
+            diameter = (width if width < height else height) * 0.95
+            self.circle.pos = (x + (width - diameter) / 2, y + (height - diameter) / 2)
             self.circle.size = (diameter, diameter)
-    
-    def _setup_animations(self):
-        """Configure les animations de fond"""
-        self.animation_angle = 0
-        Clock.schedule_interval(self._animate_background, 1/30.0)
-    
-    def _animate_background(self, dt):
-        """Animation subtile de rotation"""
-        self.animation_angle += 0.5
-        if self.animation_angle >= 360:
-            self.animation_angle = 0
 
 
 class TouchCircleDetector:
@@ -143,16 +227,26 @@ class TouchCircleDetector:
     @staticmethod
     def is_touch_in_circle(touch, widget):
         """Retourne True si le touch est dans le cercle de l'widget"""
-        if not widget.size[0] or not widget.size[1]:
+        width, height = widget.size
+        if not width or not height:
             return True
         
-        diameter = min(widget.size)
-        radius = diameter / 2
-        center_x = widget.center_x
-        center_y = widget.center_y
-        
-        distance = math.sqrt((touch.x - center_x)**2 + (touch.y - center_y)**2)
-        return distance <= radius
+        # Comparaison des carrés : pas de racine sur chaque touch
+        center_x, center_y = widget.center
+        dx = touch.x - center_x
+        dy = touch.y - center_y
+        radius = (width if width < height else height) * 0.5
+        return dx * dx + dy * dy <= radius * radius
+
+
+@lru_cache(maxsize=None)
+def _shared_animation(**properties):
+    """Animation partagée par tous les widgets ayant la même cible
+    
+    Une instance Animation n'installe qu'un seul événement Clock, quel que
+    soit le nombre de widgets qu'elle anime : N fondus simultanés = 1 tick.
+    """
+    return Animation(**properties)
 
 
 class DecoTransition:
@@ -162,8 +256,7 @@ class DecoTransition:
     def fade_in_gold(widget, duration=0.5):
         """Transition d'entrée dorée"""
         widget.opacity = 0
-        anim = Animation(opacity=1, duration=duration)
-        anim.start(widget)
+        _shared_animation(opacity=1, duration=duration).start(widget)
     
     @staticmethod
     def slide_from_center(widget, duration=0.8):
@@ -179,10 +272,28 @@ class DecoTransition:
     def sunburst_reveal(widget, duration=1.0):
         """Révélation en rayons dorés"""
         widget.opacity = 0
-        widget.scale = 0.5
         
-        anim = Animation(opacity=1, scale=1, duration=duration, t='out_elastic')
-        anim.start(widget)
+        # Les widgets n'ont pas de propriété scale : on anime une
+        # instruction Scale autour du centre, appliquée par le GPU
+        scale = DecoTransition._get_scale(widget)
+        scale.origin = widget.center
+        scale.x = scale.y = 0.5
+        
+        _shared_animation(opacity=1, duration=duration, t='out_elastic').start(widget)
+        _shared_animation(x=1, y=1, duration=duration, t='out_elastic').start(scale)
+    
+    @staticmethod
+    def _get_scale(widget):
+        """Instruction Scale encadrant le canvas du widget, créée une seule fois"""
+        scale = getattr(widget, '_deco_scale', None)
+        if scale is None:
+            with widget.canvas.before:
+                PushMatrix()
+                scale = Scale(1, 1, 1)
+            with widget.canvas.after:
+                PopMatrix()
+            widget._deco_scale = scale
+        return scale
 
 
 # Configuration globale pour écran rond
@@ -6,17 +6,71 @@ Intégration OpenAI pour création automatique de recettes
 import json
 import logging
 import asyncio
+import hashlib
+import random
 import openai
+import httpx
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import re
+import sys
 import time
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Parseur JSON rapide optionnel (ses erreurs héritent de json.JSONDecodeError)
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+    _json_loads = orjson.loads
+except ImportError:
+    ORJSON_SUPPORT = False
+    _json_loads = json.loads
+
+# Cache sémantique optionnel (similarité cosinus des embeddings)
+try:
+    import numpy as np
+    NUMPY_SUPPORT = True
+except ImportError:
+    NUMPY_SUPPORT = False
+
+# Pool de connexions HTTP partagé par tous les appels API
+_HTTP_LIMITS = httpx.Limits(max_connections=512, max_keepalive_connections=256)
+_HTTP_TIMEOUT = httpx.Timeout(60.0)
+
+# Expressions compilées une seule fois (chemin de parsing des réponses)
+_MD_JSON_RE = re.compile(r'```json\s*')
+_MD_TAIL_RE = re.compile(r'```\s*$')
+_COCKTAIL_ID_RE = re.compile(r'[^a-zA-Z0-9_]')
+
+# Erreurs passagères de l'API : seules celles-ci justifient une nouvelle tentative
+_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+_EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Attente maximale imposée par un en-tête Retry-After (secondes)
+_RETRY_AFTER_MAX = 60.0
+
+
+def _availability_index(available_ingredients: List[str]) -> Tuple[frozenset, Tuple[str, ...]]:
+    """Noms disponibles en minuscules : ensemble (exact) et tuple (sous-chaînes)"""
+    lowered = tuple(name.lower() for name in available_ingredients)
+    return frozenset(lowered), lowered
+
+
+# Sans __dict__ par instance quand Python le permet (3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class AIGeneratedCocktail:
     """Cocktail généré par IA"""
     name: str
@@ -31,49 +85,10 @@ class AIGeneratedCocktail:
     inspiration: str = ""
     generated_at: str = ""
     ai_confidence: float = 0.0
-    
-    def __post_init__(self):
-        if not self.generated_at:
-            self.generated_at = datetime.now().isoformat()
 
-class CocktailAI:
-    """Générateur IA de cocktails avec OpenAI"""
-    
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-3.5-turbo"):
-        self.api_key = api_key
-        self.model = model
-        self.client = None
-        
-        # Configuration
-        self.max_tokens = 1000
-        self.temperature = 0.8  # Créativité élevée
-        self.max_retries = 3
-        
-        # Cache des générations récentes
-        self.generation_cache = {}
-        self.cache_max_size = 50
-        
-        # Templates de prompts
-        self.prompts = self._load_prompts()
-        
-        if api_key:
-            self.set_api_key(api_key)
-    
-    def set_api_key(self, api_key: str):
-        """Configure la clé API OpenAI"""
-        self.api_key = api_key
-        try:
-            openai.api_key = api_key
-            self.client = openai.OpenAI(api_key=api_key)
-            logger.info("Client OpenAI configuré")
-        except Exception as e:
-            logger.error(f"Erreur configuration OpenAI: {e}")
-            self.client = None
-    
-    def _load_prompts(self) -> Dict[str, str]:
-        """Charge les templates de prompts"""
-        return {
-            "classic_cocktail": """
+# Templates de prompts, construits une seule fois à l'import (lecture seule)
+_PROMPTS = {
+    "classic_cocktail": """
 Tu es un mixologue expert spécialisé dans les cocktails classiques des années 1920-1940.
 Crée un cocktail sophistiqué en utilisant principalement ces ingrédients disponibles: {available_ingredients}
 
@@ -98,8 +113,8 @@ Retourne UNIQUEMENT un objet JSON valide avec cette structure:
   "story": "histoire courte du cocktail"
 }}
 """,
-            
-            "creative_cocktail": """
+    
+    "creative_cocktail": """
 Tu es un mixologue créatif moderne qui révolutionne l'art du cocktail.
 Crée un cocktail innovant avec ces ingrédients: {available_ingredients}
 
@@ -129,8 +144,8 @@ Retourne UNIQUEMENT un JSON valide:
   "inspiration": "source d'inspiration"
 }}
 """,
-            
-            "seasonal_cocktail": """
+    
+    "seasonal_cocktail": """
 Tu es un expert en cocktails saisonniers et ambiances.
 Crée un cocktail parfait pour: {occasion} en {season}
 
@@ -156,8 +171,8 @@ JSON uniquement:
   "story": "contexte saisonnier"
 }}
 """,
-            
-            "ingredient_spotlight": """
+    
+    "ingredient_spotlight": """
 Tu es un expert qui sublime un ingrédient principal.
 Crée un cocktail qui met en valeur: {main_ingredient}
 
@@ -182,7 +197,131 @@ JSON résultat:
   "story": "pourquoi ce cocktail sublime {main_ingredient}"
 }}
 """
-        }
+}
+
+
+class _StreamBuffer:
+    """Accumule les fragments d'une réponse en streaming
+    
+    Les fragments sont gardés en liste et joints une seule fois : pas de
+    concaténation quadratique. Le JSON n'est tenté que lorsque le dernier
+    caractère significatif est une accolade fermante.
+    """
+    
+    def __init__(self):
+        self._chunks: List[str] = []
+        self._last_char = ""
+    
+    def append(self, text: str):
+        if text:
+            self._chunks.append(text)
+            stripped = text.rstrip()
+            if stripped:
+                self._last_char = stripped[-1]
+    
+    def looks_complete(self) -> bool:
+        return self._last_char == "}"
+    
+    def text(self) -> str:
+        return "".join(self._chunks)
+
+
+class CocktailAI:
+    """Générateur IA de cocktails avec OpenAI"""
+    
+    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-3.5-turbo"):
+        self.api_key = api_key
+        self.model = model
+        
+        # Client et transport HTTP créés à la demande dans la boucle d'événements
+        # courante (voir client) : connexions TLS réutilisées entre les appels
+        self._client = None
+        self._http = None
+        self._client_loop = None
+        
+        # Configuration
+        self.max_tokens = 1000
+        self.temperature = 0.8  # Créativité élevée
+        self.max_retries = 3
+        self.bulk_concurrency = 8  # Requêtes simultanées max en génération groupée
+        self.stream = False  # Réception en streaming (arrêt dès le JSON complet)
+        self.json_mode = True  # Mode JSON de l'API : réponse garantie sans markdown
+        
+        # Cache LRU des générations récentes
+        self.generation_cache = OrderedDict()
+        self.cache_max_size = 50
+        
+        # Cache sémantique (optionnel, nécessite numpy) : par clé du cache,
+        # paramètres fixes et embedding normalisé des entrées libres
+        self.semantic_cache = False
+        self.semantic_threshold = 0.92
+        self._embeddings = {}
+        
+        # Templates de prompts
+        self.prompts = _PROMPTS
+        
+        if api_key:
+            self.set_api_key(api_key)
+    
+    def set_api_key(self, api_key: str):
+        """Configure la clé API OpenAI"""
+        self.api_key = api_key
+        openai.api_key = api_key
+        # Seul le client OpenAI est recréé au prochain appel : le transport
+        # HTTP et ses connexions sont conservés
+        self._client = None
+        logger.info("Client OpenAI configuré")
+    
+    @property
+    def client(self) -> Optional[openai.AsyncOpenAI]:
+        """Client OpenAI asynchrone lié à la boucle d'événements courante
+        
+        Un transport httpx ne peut pas servir dans une autre boucle que celle
+        qui l'a utilisé : client et transport sont recréés quand la boucle
+        change (plusieurs asyncio.run) ou après close(). Un changement de clé
+        ne recrée que le client. Hors boucle, le client existant est retourné
+        tel quel.
+        """
+        if not self.api_key:
+            return None
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._client
+        
+        if self._http is None or self._http.is_closed or self._client_loop is not loop:
+            self._replace_transport(loop)
+            self._client = None
+        
+        if self._client is None:
+            try:
+                # Les nouvelles tentatives sont gérées par _call_openai_api
+                self._client = openai.AsyncOpenAI(api_key=self.api_key, http_client=self._http,
+                                                  max_retries=0)
+            except Exception as e:
+                logger.error(f"Erreur configuration OpenAI: {e}")
+                self._client = None
+        return self._client
+    
+    def _replace_transport(self, loop: asyncio.AbstractEventLoop):
+        """Crée le transport HTTP de la boucle courante et libère le précédent"""
+        old_http, old_loop = self._http, self._client_loop
+        if old_http is not None and not old_http.is_closed:
+            if old_loop is not None and old_loop.is_running():
+                # Boucle toujours active (autre thread) : fermeture dans sa boucle
+                asyncio.run_coroutine_threadsafe(old_http.aclose(), old_loop)
+            else:
+                logger.warning("Boucle d'événements terminée : transport HTTP précédent abandonné")
+        
+        self._http = httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+        self._client_loop = loop
+    
+    async def close(self):
+        """Ferme le transport HTTP partagé (recréé au prochain appel)"""
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._client = None
     
     async def generate_cocktail(self, 
                               available_ingredients: List[str],
@@ -197,26 +336,28 @@ JSON résultat:
             return None
         
         try:
-            # Sélectionner le prompt approprié
-            prompt_key = self._select_prompt_type(style, special_request)
-            prompt_template = self.prompts[prompt_key]
-            
-            # Personnaliser le prompt
-            prompt = self._customize_prompt(
-                prompt_template,
-                available_ingredients,
-                style,
-                strength,
-                complexity,
-                special_request
+            prompt, cache_key = self.prepare_generation(
+                available_ingredients, style, strength, complexity, special_request
             )
             
             # Vérifier le cache
-            cache_key = self._generate_cache_key(prompt)
             if cache_key in self.generation_cache:
                 logger.info("Cocktail trouvé en cache")
+                self.generation_cache.move_to_end(cache_key)
                 return self.generation_cache[cache_key]
             
+            # Demande proche d'une demande déjà servie avec les mêmes paramètres
+            embedding = None
+            if self.semantic_cache and NUMPY_SUPPORT:
+                params = (self._select_prompt_type(style, special_request),
+                          style.strip().lower(), int(round(strength)), int(round(complexity)))
+                embedding = await self._embed_prompt(
+                    ", ".join(available_ingredients) + "\n" + special_request
+                )
+                similar = self._find_similar(embedding, params, available_ingredients)
+                if similar:
+                    return similar
+            
             # Générer avec l'IA
             logger.info(f"Génération cocktail IA: {style}, force:{strength}, complexité:{complexity}")
             
@@ -232,6 +373,8 @@ JSON résultat:
                     if validated_cocktail:
                         # Ajouter au cache
                         self._add_to_cache(cache_key, validated_cocktail)
+                        if embedding is not None:
+                            self._embeddings[cache_key] = (params, embedding)
                         return validated_cocktail
             
             logger.warning("Échec génération cocktail IA")
@@ -241,17 +384,81 @@ JSON résultat:
             logger.error(f"Erreur génération cocktail IA: {e}")
             return None
     
-    async def generate_random_cocktail(self, available_ingredients: List[str]) -> Optional[AIGeneratedCocktail]:
-        """Génère un cocktail aléatoire créatif"""
-        import random
+    def prepare_generation(self,
+                           available_ingredients: List[str],
+                           style: str = "classic",
+                           strength: int = 3,
+                           complexity: int = 3,
+                           special_request: str = "") -> Tuple[str, str]:
+        """Prompt et clé de cache d'une génération
+        
+        La clé ne dépend pas de l'ordre ni de la casse des ingrédients :
+        ["Gin", "Vodka"] et ["vodka", "gin"] partagent la même entrée du cache.
+        """
+        # Sélectionner le prompt approprié
+        prompt_key = self._select_prompt_type(style, special_request)
+        prompt_template = self.prompts[prompt_key]
         
+        # Personnaliser le prompt
+        prompt = self._customize_prompt(
+            prompt_template,
+            available_ingredients,
+            style,
+            strength,
+            complexity,
+            special_request
+        )
+        
+        # Forme canonique des paramètres, seule utilisée pour la clé
+        canonical = "|".join((
+            prompt_key,
+            ",".join(sorted({" ".join(ing.split()).lower() for ing in available_ingredients})),
+            style.strip().lower(),
+            str(int(round(strength))),
+            str(int(round(complexity))),
+            " ".join(special_request.split()).lower()
+        ))
+        return prompt, self._generate_cache_key(canonical)
+    
+    def _random_parameters(self) -> Tuple[str, int, int]:
+        """Style, force et complexité tirés au hasard"""
         styles = ["classic", "modern", "tropical", "elegant", "bold", "refined"]
         style = random.choice(styles)
         strength = random.randint(2, 5)
         complexity = random.randint(2, 4)
+        return style, strength, complexity
+    
+    async def generate_random_cocktail(self, available_ingredients: List[str]) -> Optional[AIGeneratedCocktail]:
+        """Génère un cocktail aléatoire créatif"""
+        style, strength, complexity = self._random_parameters()
         
         return await self.generate_cocktail(available_ingredients, style, strength, complexity)
     
+    async def generate_random_cocktails(self, available_ingredients: List[str],
+                                        count: int) -> List[AIGeneratedCocktail]:
+        """Génère plusieurs cocktails aléatoires en un seul appel API (n complétions)
+        
+        Le prompt n'est envoyé et facturé qu'une fois ; seuls les cocktails
+        valides sont retournés.
+        """
+        if not self.client or count < 1:
+            return []
+        
+        style, strength, complexity = self._random_parameters()
+        prompt, _ = self.prepare_generation(available_ingredients, style, strength, complexity)
+        
+        logger.info(f"Génération de {count} cocktails IA en un appel: {style}")
+        responses = await self._call_openai_api(prompt, n=count)
+        if not responses:
+            return []
+        if count == 1:
+            responses = [responses]
+        
+        parsed = [self._parse_ai_response(response) for response in responses]
+        validated = [self._validate_cocktail(cocktail, available_ingredients)
+                     for cocktail in parsed if cocktail]
+        return [cocktail for cocktail in validated if cocktail]
+    
     async def generate_ingredient_cocktail(self, 
                                          main_ingredient: str,
                                          available_ingredients: List[str]) -> Optional[AIGeneratedCocktail]:
@@ -275,6 +482,116 @@ JSON résultat:
         
         return None
     
+    async def generate_cocktails_bulk(self,
+                                      specs: List[Dict],
+                                      concurrency: Optional[int] = None) -> List:
+        """Génère plusieurs cocktails en parallèle
+        
+        Chaque spec contient les arguments de generate_cocktail. Les résultats
+        sont retournés dans l'ordre des specs (exception en cas d'échec).
+        """
+        sem = asyncio.Semaphore(concurrency or self.bulk_concurrency)
+        
+        async def _generate(spec: Dict):
+            async with sem:
+                return await self.generate_cocktail(**spec)
+        
+        logger.info(f"Génération groupée: {len(specs)} cocktails")
+        return await asyncio.gather(*(_generate(spec) for spec in specs),
+                                    return_exceptions=True)
+    
+    async def submit_batch(self, prompts: List[str], cache_keys: List[str]) -> Optional[str]:
+        """Soumet des prompts à la Batch API (traitement différé, coût réduit)
+        
+        Destiné à la pré-génération hors ligne : les résultats arrivent
+        sous 24h et sont récupérés avec poll_batch. prompts et cache_keys
+        proviennent de prepare_generation, ce qui permet à generate_cocktail
+        de retrouver les cocktails en cache. Les clés en double ne sont
+        soumises qu'une fois (la Batch API refuse les custom_id dupliqués).
+        """
+        if len(prompts) != len(cache_keys):
+            raise ValueError(f"{len(prompts)} prompts pour {len(cache_keys)} clés de cache")
+        
+        if not self.client:
+            return None
+        
+        # Une requête par clé de cache, qui sert d'identifiant de ligne
+        unique = {}
+        for cache_key, prompt in zip(cache_keys, prompts):
+            unique.setdefault(cache_key, prompt)
+        lines = [
+            json.dumps({
+                "custom_id": cache_key,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._build_request_body(prompt)
+            }, ensure_ascii=False)
+            for cache_key, prompt in unique.items()
+        ]
+        
+        try:
+            batch_file = await self.client.files.create(
+                file=("cocktails_batch.jsonl", "\n".join(lines).encode('utf-8')),
+                purpose="batch"
+            )
+            batch = await self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logger.info(f"Batch IA soumis: {batch.id} ({len(lines)} prompts)")
+            return batch.id
+        except Exception as e:
+            logger.error(f"Erreur soumission batch IA: {e}")
+            return None
+    
+    async def poll_batch(self, batch_id: str,
+                         available_ingredients: List[str],
+                         poll_interval: float = 60.0) -> List[AIGeneratedCocktail]:
+        """Attend la fin d'un batch et place les cocktails valides en cache"""
+        if not self.client:
+            return []
+        
+        try:
+            batch = await self.client.batches.retrieve(batch_id)
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                await asyncio.sleep(poll_interval)
+                batch = await self.client.batches.retrieve(batch_id)
+            
+            if batch.status != "completed" or not batch.output_file_id:
+                logger.warning(f"Batch IA {batch_id} terminé sans résultat: {batch.status}")
+                return []
+            
+            output = await self.client.files.content(batch.output_file_id)
+        except Exception as e:
+            logger.error(f"Erreur récupération batch IA: {e}")
+            return []
+        
+        # Un seul horodatage pour tout le lot
+        generated_at = datetime.now().isoformat()
+        cocktails = []
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                result = _json_loads(line)
+                body = result["response"]["body"]
+                content = body["choices"][0]["message"]["content"]
+            except (json.JSONDecodeError, KeyError, IndexError, TypeError) as e:
+                logger.warning(f"Résultat batch ignoré: {e}")
+                continue
+            
+            cocktail = self._parse_ai_response(content)
+            if cocktail:
+                validated_cocktail = self._validate_cocktail(cocktail, available_ingredients,
+                                                             generated_at)
+                if validated_cocktail:
+                    self._add_to_cache(result["custom_id"], validated_cocktail)
+                    cocktails.append(validated_cocktail)
+        
+        logger.info(f"Batch IA {batch_id}: {len(cocktails)} cocktails en cache")
+        return cocktails
+    
     async def suggest_improvements(self, cocktail_data: Dict) -> Optional[str]:
         """Suggère des améliorations pour un cocktail existant"""
         
@@ -340,41 +657,118 @@ Réponds en français, soyez concis et pratique.
             # Si certaines variables manquent, utiliser le template de base
             return template.replace("{available_ingredients}", ", ".join(ingredients))
     
-    async def _call_openai_api(self, prompt: str) -> Optional[str]:
-        """Appelle l'API OpenAI avec gestion des erreurs"""
+    def _build_request_body(self, prompt: str) -> Dict:
+        """Corps d'une requête chat.completions (appel direct ou Batch API)"""
+        body = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "Tu es un mixologue expert qui crée des cocktails sophistiqués. Réponds UNIQUEMENT avec du JSON valide."
+                },
+                {
+                    "role": "user", 
+                    "content": prompt
+                }
+            ],
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature
+        }
+        if self.json_mode:
+            # _clean_json_response reste utile pour les modèles sans ce mode
+            body["response_format"] = {"type": "json_object"}
+        return body
+    
+    async def _call_openai_api(self, prompt: str, n: int = 1):
+        """Appelle l'API OpenAI avec gestion des erreurs
+        
+        Retourne le contenu de la réponse, ou la liste des n contenus si n > 1.
+        """
         
         for attempt in range(self.max_retries):
             try:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "Tu es un mixologue expert qui crée des cocktails sophistiqués. Réponds UNIQUEMENT avec du JSON valide."
-                        },
-                        {
-                            "role": "user", 
-                            "content": prompt
-                        }
-                    ],
-                    max_tokens=self.max_tokens,
-                    temperature=self.temperature
-                )
+                if n > 1:
+                    response = await self.client.chat.completions.create(
+                        n=n, **self._build_request_body(prompt)
+                    )
+                    contents = [choice.message.content for choice in response.choices]
+                    logger.debug(f"{len(contents)} réponses IA reçues")
+                    return contents
+                
+                if self.stream:
+                    content = await self._stream_completion(prompt)
+                else:
+                    response = await self.client.chat.completions.create(
+                        **self._build_request_body(prompt)
+                    )
+                    content = response.choices[0].message.content
                 
-                content = response.choices[0].message.content
                 logger.debug(f"Réponse IA reçue: {len(content)} caractères")
                 return content
                 
-            except Exception as e:
+            except _RETRYABLE_ERRORS as e:
                 logger.warning(f"Tentative {attempt + 1}/{self.max_retries} échouée: {e}")
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)  # Backoff exponentiel
+                    await asyncio.sleep(self._retry_delay(e, attempt))
                 else:
                     logger.error("Toutes les tentatives API échouées")
                     return None
+            
+            except Exception as e:
+                # Erreur définitive (requête invalide, clé refusée...) : inutile de réessayer
+                logger.error(f"Erreur API non récupérable: {e}")
+                return None
         
         return None
     
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int) -> float:
+        """Délai avant nouvelle tentative : Retry-After si fourni, sinon backoff avec jitter
+        
+        Retry-After est accepté en secondes ou en date HTTP, et plafonné à
+        _RETRY_AFTER_MAX pour qu'un serveur ne bloque pas la génération.
+        """
+        response = getattr(error, 'response', None)
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            if retry_after:
+                try:
+                    delay = float(retry_after)
+                except ValueError:
+                    try:
+                        retry_at = parsedate_to_datetime(retry_after)
+                        if retry_at.tzinfo is None:  # "-0000" : UTC sans fuseau explicite
+                            retry_at = retry_at.replace(tzinfo=timezone.utc)
+                        delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+                    except (TypeError, ValueError):
+                        delay = None
+                if delay is not None:
+                    return min(max(0.0, delay), _RETRY_AFTER_MAX)
+        
+        # Jitter complet : les coroutines concurrentes ne réessaient pas ensemble
+        return random.uniform(0, 2 ** (attempt + 1))
+    
+    async def _stream_completion(self, prompt: str) -> str:
+        """Reçoit la réponse en streaming, jusqu'au premier JSON complet"""
+        buffer = _StreamBuffer()
+        stream = await self.client.chat.completions.create(
+            stream=True, **self._build_request_body(prompt)
+        )
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                buffer.append(chunk.choices[0].delta.content)
+                if buffer.looks_complete():
+                    try:
+                        _json_loads(self._clean_json_response(buffer.text()))
+                        break  # Inutile d'attendre la fin du bloc markdown
+                    except json.JSONDecodeError:
+                        pass
+        finally:
+            await stream.close()
+        return buffer.text()
+    
     def _parse_ai_response(self, response: str) -> Optional[AIGeneratedCocktail]:
         """Parse la réponse IA en objet cocktail"""
         
@@ -383,7 +777,7 @@ Réponds en français, soyez concis et pratique.
             cleaned = self._clean_json_response(response)
             
             # Parser JSON
-            data = json.loads(cleaned)
+            data = _json_loads(cleaned)
             
             # Créer objet cocktail
             cocktail = AIGeneratedCocktail(**data)
@@ -402,9 +796,15 @@ Réponds en français, soyez concis et pratique.
     def _clean_json_response(self, response: str) -> str:
         """Nettoie la réponse IA pour extraire le JSON"""
         
-        # Enlever les blocs markdown
-        response = re.sub(r'```json\s*', '', response)
-        response = re.sub(r'```\s*$', '', response)
+        # Cas courant : JSON pur, sans aucun traitement
+        stripped = response.strip()
+        if stripped.startswith('{') and stripped.endswith('}'):
+            return stripped
+        
+        # Enlever les blocs markdown, seulement s'il y en a
+        if '```' in response:
+            response = _MD_JSON_RE.sub('', response)
+            response = _MD_TAIL_RE.sub('', response)
         
         # Enlever texte avant/après JSON
         json_start = response.find('{')
@@ -416,8 +816,12 @@ Réponds en français, soyez concis et pratique.
         return response.strip()
     
     def _validate_cocktail(self, cocktail: AIGeneratedCocktail, 
-                          available_ingredients: List[str]) -> Optional[AIGeneratedCocktail]:
-        """Valide et nettoie un cocktail généré"""
+                          available_ingredients: List[str],
+                          generated_at: Optional[str] = None) -> Optional[AIGeneratedCocktail]:
+        """Valide et nettoie un cocktail généré
+        
+        L'horodatage n'est posé qu'ici, sur les cocktails retenus.
+        """
         
         try:
             # Vérifier nom
@@ -425,13 +829,14 @@ Réponds en français, soyez concis et pratique.
                 logger.warning("Nom de cocktail invalide")
                 return None
             
-            # Vérifier ingrédients disponibles
+            # Vérifier ingrédients disponibles (noms minuscules calculés une fois)
+            available = _availability_index(available_ingredients)
             valid_ingredients = []
             for ingredient in cocktail.ingredients:
                 ingredient_name = ingredient.get('name', '')
                 
                 # Vérifier si l'ingrédient est disponible
-                if self._is_ingredient_available(ingredient_name, available_ingredients):
+                if self._is_ingredient_available(ingredient_name, available):
                     # Valider quantité
                     amount = ingredient.get('amount_ml', 30)
                     if isinstance(amount, str):
@@ -451,6 +856,9 @@ Réponds en français, soyez concis et pratique.
                 else:
                     logger.warning(f"Ingrédient non disponible ignoré: {ingredient_name}")
             
+            # Connu dès le filtrage : aucun ingrédient écarté
+            all_available = len(valid_ingredients) == len(cocktail.ingredients)
+            
             if len(valid_ingredients) < 2:
                 logger.warning("Pas assez d'ingrédients valides")
                 return None
@@ -466,8 +874,11 @@ Réponds en français, soyez concis et pratique.
             if not cocktail.category:
                 cocktail.category = "modern"
             
+            if not cocktail.generated_at:
+                cocktail.generated_at = generated_at or datetime.now().isoformat()
+            
             # Calculer confiance IA
-            cocktail.ai_confidence = self._calculate_confidence(cocktail, available_ingredients)
+            cocktail.ai_confidence = self._calculate_confidence(cocktail, all_available)
             
             logger.info(f"Cocktail validé: {cocktail.name} ({cocktail.ai_confidence:.1f}% confiance)")
             return cocktail
@@ -476,17 +887,19 @@ Réponds en français, soyez concis et pratique.
             logger.error(f"Erreur validation cocktail: {e}")
             return None
     
-    def _is_ingredient_available(self, ingredient_name: str, available_ingredients: List[str]) -> bool:
-        """Vérifie si un ingrédient est disponible"""
+    def _is_ingredient_available(self, ingredient_name: str,
+                                 available: Tuple[frozenset, Tuple[str, ...]]) -> bool:
+        """Vérifie si un ingrédient est disponible (index de _availability_index)"""
+        names, lowered = available
         ingredient_lower = ingredient_name.lower()
         
-        for available in available_ingredients:
-            if ingredient_lower in available.lower() or available.lower() in ingredient_lower:
-                return True
+        # Correspondance exacte : simple recherche dans le frozenset
+        if ingredient_lower in names:
+            return True
         
-        return False
+        return any(ingredient_lower in name or name in ingredient_lower for name in lowered)
     
-    def _calculate_confidence(self, cocktail: AIGeneratedCocktail, available_ingredients: List[str]) -> float:
+    def _calculate_confidence(self, cocktail: AIGeneratedCocktail, all_available: bool) -> float:
         """Calcule un score de confiance pour le cocktail généré"""
         
         score = 0.0
@@ -496,8 +909,7 @@ Réponds en français, soyez concis et pratique.
             score += 20
         
         # Tous les ingrédients disponibles (30%)
-        if all(self._is_ingredient_available(ing['name'], available_ingredients) 
-               for ing in cocktail.ingredients):
+        if all_available:
             score += 30
         
         # Instructions détaillées (20%)
@@ -516,15 +928,61 @@ Réponds en français, soyez concis et pratique.
     
     def _generate_cache_key(self, prompt: str) -> str:
         """Génère une clé de cache pour un prompt"""
-        import hashlib
-        return hashlib.md5(prompt.encode()).hexdigest()[:12]
+        # BLAKE2b à 8 octets : plus rapide que MD5, clé de 16 caractères sans troncature
+        return hashlib.blake2b(prompt.encode('utf-8'), digest_size=8).hexdigest()
+    
+    async def _embed_prompt(self, text: str):
+        """Embedding normalisé des entrées libres (ingrédients, demande spéciale)
+        
+        Le template du prompt n'est pas inclus : commun à toutes les
+        demandes, il rendrait proches des prompts aux paramètres différents.
+        """
+        if not self.client:
+            return None
+        
+        try:
+            response = await self.client.embeddings.create(model=_EMBEDDING_MODEL, input=text)
+            vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+            return vector / np.linalg.norm(vector)
+        except Exception as e:
+            logger.warning(f"Embedding indisponible, cache sémantique ignoré: {e}")
+            return None
+    
+    def _find_similar(self, embedding, params: Tuple,
+                      available_ingredients: List[str]) -> Optional[AIGeneratedCocktail]:
+        """Cocktail en cache aux mêmes paramètres et aux entrées assez proches (similarité cosinus)"""
+        if embedding is None:
+            return None
+        
+        # Seules les générations de même type, style, force et complexité sont comparables
+        keys = [key for key, (key_params, _) in self._embeddings.items() if key_params == params]
+        if not keys:
+            return None
+        
+        similarities = np.stack([self._embeddings[key][1] for key in keys]) @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.semantic_threshold:
+            return None
+        
+        # Le cocktail trouvé doit rester réalisable avec les ingrédients actuels
+        cocktail = self.generation_cache.get(keys[best])
+        available = _availability_index(available_ingredients)
+        if cocktail is None or not all(self._is_ingredient_available(ing['name'], available)
+                                       for ing in cocktail.ingredients):
+            return None
+        
+        logger.info(f"Cocktail trouvé en cache sémantique ({similarities[best]:.2f})")
+        self.generation_cache.move_to_end(keys[best])
+        return cocktail
     
     def _add_to_cache(self, key: str, cocktail: AIGeneratedCocktail):
         """Ajoute un cocktail au cache"""
-        if len(self.generation_cache) >= self.cache_max_size:
-            # Supprimer le plus ancien
-            oldest_key = next(iter(self.generation_cache))
-            del self.generation_cache[oldest_key]
+        if key in self.generation_cache:
+            self.generation_cache.move_to_end(key)
+        elif len(self.generation_cache) >= self.cache_max_size:
+            # Supprimer le moins récemment utilisé
+            oldest_key, _ = self.generation_cache.popitem(last=False)
+            self._embeddings.pop(oldest_key, None)
         
         self.generation_cache[key] = cocktail
     
@@ -532,7 +990,8 @@ Réponds en français, soyez concis et pratique.
         """Récupère les statistiques de génération"""
         return {
             'cache_size': len(self.generation_cache),
-            'api_configured': self.client is not None,
+            'semantic_cache': self.semantic_cache,
+            'api_configured': bool(self.api_key),
             'model': self.model,
             'max_tokens': self.max_tokens,
             'temperature': self.temperature
@@ -543,7 +1002,6 @@ def create_cocktail_from_ai(ai_cocktail: AIGeneratedCocktail) -> Dict:
     """Convertit un cocktail IA en format système"""
     try:
         from cocktail_manager import CocktailRecipe, Ingredient
-        from datetime import datetime
         
         # Créer les ingrédients
         ingredients = []
@@ -556,8 +1014,7 @@ def create_cocktail_from_ai(ai_cocktail: AIGeneratedCocktail) -> Dict:
             ingredients.append(ingredient)
         
         # Générer ID unique
-        import re
-        cocktail_id = re.sub(r'[^a-zA-Z0-9_]', '_', ai_cocktail.name.lower())
+        cocktail_id = _COCKTAIL_ID_RE.sub('_', ai_cocktail.name.lower())
         
         # Créer la recette
         cocktail = CocktailRecipe(
@@ -589,8 +1046,6 @@ def get_cocktail_ai() -> CocktailAI:
 
 if __name__ == "__main__":
     # Test du générateur IA (nécessite clé API)
-    import asyncio
-    
     async def test_ai():
         ai = get_cocktail_ai()
         
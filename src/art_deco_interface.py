@@ -12,11 +12,24 @@ import logging
 from typing import List, Dict, Optional, Tuple, Callable
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import threading
 from hardware_config import SCREEN_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Instant de la frame en cours (time.monotonic()), fixé par la boucle principale
+_frame_time: Optional[float] = None
+
+def set_frame_time(timestamp: float):
+    """Fixe l'instant partagé par les animations de la frame"""
+    global _frame_time
+    _frame_time = timestamp
+
+def frame_time() -> float:
+    """Instant de la frame en cours, ou l'horloge monotone hors boucle principale"""
+    return _frame_time if _frame_time is not None else time.monotonic()
+
 # Initialisation Pygame sera faite dans initialize()
 # pygame.init() - Déplacé dans la méthode initialize()
 # pygame.mixer.init() - Déplacé dans la méthode initialize()
@@ -29,7 +42,7 @@ class GestureEvent:
     end_pos: Tuple[int, int]
     distance: float
     velocity: float
-    timestamp: float
+    timestamp: float  # time.monotonic() du relâchement
 
 class GestureManager:
     """Gestionnaire des gestes tactiles pour interface moderne avec animations fluides"""
@@ -68,12 +81,14 @@ class GestureManager:
             self.callbacks[gesture_type].append(callback)
     
     def handle_event(self, event) -> Optional[GestureEvent]:
-        """Traite les événements tactiles/souris avec animations fluides"""
-        current_time = time.time()
+        """Traite les événements tactiles/souris avec animations fluides
         
+        Les instants d'appui et de relâchement sont lus à la réception de
+        l'événement, et non à la frame : un tap bref tient dans une frame.
+        """
         if event.type == pygame.MOUSEBUTTONDOWN:
             self.touch_start = pygame.mouse.get_pos()
-            self.touch_start_time = current_time
+            self.touch_start_time = time.monotonic()
             self.is_dragging = False
             self.drag_offset = 0
             self._trigger_callbacks_with_data('drag_start', {'position': self.touch_start})
@@ -110,7 +125,7 @@ class GestureManager:
         
         elif event.type == pygame.MOUSEBUTTONUP and self.touch_start:
             touch_end = pygame.mouse.get_pos()
-            touch_end_time = current_time
+            touch_end_time = time.monotonic()
             
             # Calculer distance et vélocité
             dx = touch_end[0] - self.touch_start[0]
@@ -127,7 +142,8 @@ class GestureManager:
                 
                 # Swipe confirmé si dépassement du seuil ou vélocité suffisante
                 if abs_offset > self.min_swipe_threshold or velocity > self.min_velocity:
-                    gesture_event = self._create_gesture_event(dx, dy, distance, velocity)
+                    gesture_event = self._create_gesture_event(dx, dy, distance, velocity,
+                                                               touch_end_time)
                     if gesture_event:
                         self._trigger_callbacks(gesture_event)
                         # Animation de retour fluide
@@ -165,8 +181,9 @@ class GestureManager:
         else:  # Geste vertical
             return 'swipe_down' if dy > 0 else 'swipe_up'
     
-    def _create_gesture_event(self, dx: float, dy: float, distance: float, velocity: float) -> Optional[GestureEvent]:
-        """Crée un événement de geste"""
+    def _create_gesture_event(self, dx: float, dy: float, distance: float, velocity: float,
+                              timestamp: float) -> Optional[GestureEvent]:
+        """Crée un événement de geste (timestamp en time.monotonic())"""
         gesture_type = self._detect_gesture_direction(dx, dy)
         
         return GestureEvent(
@@ -175,7 +192,7 @@ class GestureManager:
             end_pos=(self.touch_start[0] + dx, self.touch_start[1] + dy),
             distance=distance,
             velocity=velocity,
-            timestamp=time.time()
+            timestamp=timestamp
         )
     
     def _trigger_callbacks(self, gesture_event: GestureEvent):
@@ -340,7 +357,7 @@ class AnimationType(Enum):
 
 @dataclass
 class Animation:
-    """Configuration d'animation"""
+    """Configuration d'animation (start_time en unités de frame_time())"""
     type: AnimationType
     duration: float
     start_time: float
@@ -351,7 +368,7 @@ class Animation:
     @property
     def progress(self) -> float:
         """Progression de l'animation (0.0 à 1.0)"""
-        elapsed = time.time() - self.start_time
+        elapsed = frame_time() - self.start_time
         return min(1.0, elapsed / self.duration)
     
     @property
@@ -367,6 +384,18 @@ class Animation:
         
         return self.start_value + (self.end_value - self.start_value) * p
 
+def _ease_in_elastic_exact(t: float) -> float:
+    """Formule exacte de ease_in_elastic, utilisée pour construire sa table"""
+    c4 = (2 * math.pi) / 3
+    if t == 0 or t == 1:
+        return t
+    return -pow(2, 10 * t - 10) * math.sin((t * 10 - 10.75) * c4)
+
+# Table de ease_in_elastic (pow + sin) précalculée sur [0, 1]
+_EASING_LUT_SIZE = 1024
+_ELASTIC_LUT = tuple(_ease_in_elastic_exact(i / (_EASING_LUT_SIZE - 1))
+                     for i in range(_EASING_LUT_SIZE))
+
 class EasingFunctions:
     """Fonctions d'interpolation pour animations fluides"""
     
@@ -376,20 +405,25 @@ class EasingFunctions:
     
     @staticmethod
     def ease_out_cubic(t: float) -> float:
-        return 1 - pow(1 - t, 3)
+        u = 1 - t
+        return 1 - u * u * u
     
     @staticmethod
     def ease_in_out_cubic(t: float) -> float:
         if t < 0.5:
             return 4 * t * t * t
-        return 1 - pow(-2 * t + 2, 3) / 2
+        u = -2 * t + 2
+        return 1 - u * u * u / 2
     
     @staticmethod
     def ease_in_elastic(t: float) -> float:
-        c4 = (2 * math.pi) / 3
-        if t == 0 or t == 1:
-            return t
-        return -pow(2, 10 * t - 10) * math.sin((t * 10 - 10.75) * c4)
+        # Lecture de table avec interpolation linéaire entre deux points voisins
+        if t <= 0 or t >= 1:
+            return 0.0 if t <= 0 else 1.0
+        position = t * (_EASING_LUT_SIZE - 1)
+        index = int(position)
+        low = _ELASTIC_LUT[index]
+        return low + (_ELASTIC_LUT[index + 1] - low) * (position - index)
     
     @staticmethod
     def ease_out_bounce(t: float) -> float:
@@ -405,6 +439,134 @@ class EasingFunctions:
         else:
             return n1 * (t := t - 2.625 / d1) * t + 0.984375
 
+# Ressort à amortissement critique des animations d'éléments
+_SPRING_FREQUENCY = 2.0  # Hz
+_SPRING_MAX_DT = 1 / 20  # Pas maximal : reste stable après une frame lente
+
+def _spring_step(current: float, velocity: float, target: float, dt: float,
+                 frequency: float = _SPRING_FREQUENCY) -> Tuple[float, float]:
+    """Avance d'un pas un ressort critique vers la cible, retourne (position, vitesse)
+    
+    Contrairement à une interpolation « diff * 0.1 », la vitesse est conservée
+    quand la cible change en cours de route : pas d'à-coup, durée indépendante
+    du framerate.
+    """
+    dt = min(dt, _SPRING_MAX_DT)
+    omega = 2 * math.pi * frequency
+    k1 = 2 / omega
+    k2 = 1 / (omega * omega)
+    current += velocity * dt
+    velocity += (target - current - k1 * velocity) * dt / k2
+    return current, velocity
+
+def _prepare_surface(surface: pygame.Surface) -> pygame.Surface:
+    """Convertit une surface mise en cache au format de l'écran (blit rapide)"""
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
+
+def _blit_all(target: pygame.Surface, blit_sequence: List[Tuple[pygame.Surface, Tuple[int, int]]]):
+    """Blits groupés en un appel : fblits (pygame-ce) ou blits à défaut"""
+    fblits = getattr(target, 'fblits', None)
+    if fblits is not None:
+        fblits(blit_sequence)
+    else:
+        target.blits(blit_sequence, doreturn=False)
+
+@lru_cache(maxsize=512)
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Texte antialiasé rendu une seule fois par (police, texte, couleur)
+    
+    La surface retournée est partagée : ne pas la modifier (set_alpha...).
+    """
+    return _prepare_surface(font.render(text, True, color))
+
+# Géométrie fixe des ornements : calculée une fois par rectangle, puis réutilisée
+@lru_cache(maxsize=32)
+def _corner_ornament_polys(x: int, y: int, width: int, height: int, corner_size: int = 8) -> tuple:
+    """Triangles des coins d'un bouton"""
+    right = x + width - 5
+    bottom = y + height - 5
+    left = x + 5
+    top = y + 5
+    return (
+        # Coin supérieur gauche
+        ((left, top), (left + corner_size, top), (left, top + corner_size)),
+        # Coin supérieur droit
+        ((right, top), (right - corner_size, top), (right, top + corner_size)),
+        # Coin inférieur gauche
+        ((left, bottom), (left + corner_size, bottom), (left, bottom - corner_size)),
+        # Coin inférieur droit
+        ((right, bottom), (right - corner_size, bottom), (right, bottom - corner_size)),
+    )
+
+@lru_cache(maxsize=64)
+def _corner_pattern_polys(x: int, y: int, width: int, height: int, size: int = 15) -> tuple:
+    """Motifs géométriques des coins d'une carte"""
+    half = size // 2
+    left = x + 10
+    top = y + 10
+    right = x + width - 10 - size
+    bottom = y + height - 10 - size
+    return (
+        # Haut gauche
+        ((left, top + size), (left + half, top), (left + size, top + half),
+         (left + half, top + size), (left, top + half)),
+        # Haut droit
+        ((right, top + half), (right + half, top), (right + size, top + size),
+         (right + half, top + size), (right + size, top + half)),
+        # Bas gauche
+        ((left, bottom + half), (left + half, bottom + size), (left + size, bottom + half),
+         (left + half, bottom), (left, bottom)),
+        # Bas droit
+        ((right + size, bottom), (right + half, bottom + size), (right, bottom + half),
+         (right + half, bottom), (right + size, bottom + half)),
+    )
+
+@lru_cache(maxsize=32)
+def _separator_diamond(center_x: int, y: int, diamond_size: int = 6) -> tuple:
+    """Losange central du séparateur décoratif"""
+    return (
+        (center_x, y - diamond_size),
+        (center_x + diamond_size, y),
+        (center_x, y + diamond_size),
+        (center_x - diamond_size, y),
+    )
+
+@lru_cache(maxsize=32)
+def _star_points(x: float, y: float, size: int) -> tuple:
+    """Sommets d'une étoile Art Déco à 8 branches"""
+    points = []
+    for i in range(8):
+        angle = (i * 45) * math.pi / 180
+        radius = size if i % 2 == 0 else size // 2
+        points.append((x + math.cos(angle) * radius, y + math.sin(angle) * radius))
+    return tuple(points)
+
+# Dégradés rendus une seule fois puis réutilisés
+_SHINE_TEMPLATE_HEIGHT = 32
+
+@lru_cache(maxsize=1)
+def _shine_template() -> pygame.Surface:
+    """Dégradé vertical ivoire (alpha 50 -> 0) d'un pixel de large"""
+    template = pygame.Surface((1, _SHINE_TEMPLATE_HEIGHT), pygame.SRCALPHA)
+    for i in range(_SHINE_TEMPLATE_HEIGHT):
+        alpha = int(50 * (1 - i / _SHINE_TEMPLATE_HEIGHT))
+        template.set_at((0, i), (*Colors.IVORY[:3], alpha))
+    return template
+
+@lru_cache(maxsize=8)
+def _selection_glow(radius: int) -> pygame.Surface:
+    """Halo doré d'un élément sélectionné du menu circulaire, par rayon"""
+    glow_surface = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
+    
+    for r in range(radius, radius * 2, 2):
+        alpha = int(30 * (1 - (r - radius) / radius))
+        color = (*Colors.GOLD[:3], alpha)
+        pygame.draw.circle(glow_surface, color, (radius * 2, radius * 2), r)
+    
+    return _prepare_surface(glow_surface)
+
 class ArtDecoElement:
     """Élément de base de l'interface Art Déco"""
     
@@ -446,6 +608,8 @@ class ArtDecoElement:
 class ArtDecoButton(ArtDecoElement):
     """Bouton Art Déco avec animations et effets visuels"""
     
+    _MARGIN = 3  # Débord du cadre extérieur autour du bouton
+    
     def __init__(self, x: int, y: int, width: int, height: int, text: str, 
                  callback: Optional[Callable] = None):
         super().__init__(x, y, width, height)
@@ -458,8 +622,42 @@ class ArtDecoButton(ArtDecoElement):
         self.press_color = Colors.DARK_GOLD
         self.text_color = Colors.DEEP_BLACK
         
-    def draw(self, surface: pygame.Surface, fonts: Fonts):
-        """Dessine le bouton avec style Art Déco"""
+        # Rendus mis en cache par état : un seul blit par frame
+        self._cache: Dict[tuple, pygame.Surface] = {}
+        self._drawn_key = None  # État affiché à l'écran (rendu par zones)
+    
+    @property
+    def screen_rect(self) -> pygame.Rect:
+        """Zone occupée à l'écran, cadre extérieur compris"""
+        margin = self._MARGIN
+        return pygame.Rect(self.x - margin, self.y - margin,
+                           self.width + margin * 2, self.height + margin * 2)
+    
+    def _state_key(self, fonts: Fonts) -> tuple:
+        """Clé de cache du rendu actuel"""
+        return (self.is_pressed, self.is_hovered, self.width, self.height, self.text, id(fonts))
+    
+    def invalidate(self):
+        """Oublie les rendus en cache (couleurs modifiées)"""
+        self._cache.clear()
+    
+    def get_surface(self, fonts: Fonts) -> pygame.Surface:
+        """Rendu du bouton dans l'état actuel, rastérisé à la première demande"""
+        key = self._state_key(fonts)
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = self._cache[key] = self._render_to_surface(fonts)
+        return cached
+    
+    def draw(self, surface: pygame.Surface, fonts: Fonts) -> pygame.Rect:
+        """Dessine le bouton avec style Art Déco, retourne la zone modifiée"""
+        return surface.blit(self.get_surface(fonts), (self.x - self._MARGIN, self.y - self._MARGIN))
+    
+    def _render_to_surface(self, fonts: Fonts) -> pygame.Surface:
+        """Rastérise le bouton (cadre compris) sur une surface transparente"""
+        margin = self._MARGIN
+        surface = pygame.Surface((self.width + margin * 2, self.height + margin * 2), pygame.SRCALPHA)
+        
         # Déterminer la couleur selon l'état
         if self.is_pressed:
             color = self.press_color
@@ -469,11 +667,11 @@ class ArtDecoButton(ArtDecoElement):
             color = self.base_color
         
         # Dessiner le cadre extérieur (biseauté)
-        outer_rect = pygame.Rect(self.x - 3, self.y - 3, self.width + 6, self.height + 6)
+        outer_rect = pygame.Rect(0, 0, self.width + margin * 2, self.height + margin * 2)
         pygame.draw.rect(surface, Colors.CHARCOAL, outer_rect, 0, 8)
         
         # Dessiner le bouton principal
-        main_rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        main_rect = pygame.Rect(margin, margin, self.width, self.height)
         pygame.draw.rect(surface, color, main_rect, 0, 5)
         
         # Bordure intérieure
@@ -484,59 +682,28 @@ class ArtDecoButton(ArtDecoElement):
         
         # Texte centré
         font = fonts.get('medium')
-        text_surface = font.render(self.text, True, self.text_color)
+        text_surface = render_text(font, self.text, self.text_color)
         text_rect = text_surface.get_rect(center=main_rect.center)
         surface.blit(text_surface, text_rect)
         
         # Effet de brillance si survolé
         if self.is_hovered:
             self._draw_shine_effect(surface, main_rect)
+        
+        return _prepare_surface(surface)
     
     def _draw_corner_ornaments(self, surface: pygame.Surface, rect: pygame.Rect):
         """Dessine les ornements Art Déco dans les coins"""
-        corner_size = 8
-        
-        # Coin supérieur gauche
-        points = [
-            (rect.x + 5, rect.y + 5),
-            (rect.x + corner_size + 5, rect.y + 5),
-            (rect.x + 5, rect.y + corner_size + 5)
-        ]
-        pygame.draw.polygon(surface, Colors.BRONZE, points)
-        
-        # Coin supérieur droit
-        points = [
-            (rect.x + rect.width - 5, rect.y + 5),
-            (rect.x + rect.width - corner_size - 5, rect.y + 5),
-            (rect.x + rect.width - 5, rect.y + corner_size + 5)
-        ]
-        pygame.draw.polygon(surface, Colors.BRONZE, points)
-        
-        # Coin inférieur gauche
-        points = [
-            (rect.x + 5, rect.y + rect.height - 5),
-            (rect.x + corner_size + 5, rect.y + rect.height - 5),
-            (rect.x + 5, rect.y + rect.height - corner_size - 5)
-        ]
-        pygame.draw.polygon(surface, Colors.BRONZE, points)
-        
-        # Coin inférieur droit
-        points = [
-            (rect.x + rect.width - 5, rect.y + rect.height - 5),
-            (rect.x + rect.width - corner_size - 5, rect.y + rect.height - 5),
-            (rect.x + rect.width - 5, rect.y + rect.height - corner_size - 5)
-        ]
-        pygame.draw.polygon(surface, Colors.BRONZE, points)
+        for points in _corner_ornament_polys(rect.x, rect.y, rect.width, rect.height):
+            pygame.draw.polygon(surface, Colors.BRONZE, points)
     
     def _draw_shine_effect(self, surface: pygame.Surface, rect: pygame.Rect):
         """Dessine un effet de brillance"""
-        # Créer un dégradé de brillance
-        shine_surface = pygame.Surface((rect.width, rect.height // 3), pygame.SRCALPHA)
-        for i in range(rect.height // 3):
-            alpha = int(50 * (1 - i / (rect.height // 3)))
-            color = (*Colors.IVORY[:3], alpha)
-            pygame.draw.line(shine_surface, color, (0, i), (rect.width, i))
-        
+        # Dégradé de brillance : gabarit étiré, sans boucle de lignes
+        shine_height = rect.height // 3
+        if shine_height <= 0:
+            return
+        shine_surface = pygame.transform.smoothscale(_shine_template(), (rect.width, shine_height))
         surface.blit(shine_surface, (rect.x, rect.y))
     
     def handle_event(self, event: pygame.event.Event) -> bool:
@@ -573,7 +740,40 @@ class CircularMenu(ArtDecoElement):
         self.rotation_angle = 0
         self.target_rotation = 0
         self.is_rotating = False
+        self._velocity = 0.0
         
+        # Positions des éléments, recalculées seulement quand la rotation change
+        self._unit_vectors: List[Tuple[float, float]] = []
+        self._positions: List[Tuple[int, int]] = []
+        self._positions_key = None
+    
+    def _item_positions(self) -> List[Tuple[int, int]]:
+        """Centres (entiers) des éléments pour la rotation actuelle"""
+        item_count = len(self.items)
+        key = (self.rotation_angle, item_count, self.radius, self.center_x, self.center_y)
+        if key == self._positions_key:
+            return self._positions
+        
+        # Vecteurs unitaires de base : trigonométrie une fois par nombre d'éléments
+        if len(self._unit_vectors) != item_count:
+            angle_step = 2 * math.pi / item_count
+            self._unit_vectors = [(math.cos(i * angle_step), math.sin(i * angle_step))
+                                  for i in range(item_count)]
+        
+        # Rotation de l'ensemble : un seul cos/sin quel que soit le nombre d'éléments
+        cos_r = math.cos(self.rotation_angle)
+        sin_r = math.sin(self.rotation_angle)
+        item_radius = self.radius - 60
+        center_x = self.center_x
+        center_y = self.center_y
+        self._positions = [
+            (int(center_x + (ux * cos_r - uy * sin_r) * item_radius),
+             int(center_y + (ux * sin_r + uy * cos_r) * item_radius))
+            for ux, uy in self._unit_vectors
+        ]
+        self._positions_key = key
+        return self._positions
+    
     def draw(self, surface: pygame.Surface, fonts: Fonts):
         """Dessine le menu circulaire"""
         if not self.items:
@@ -585,16 +785,7 @@ class CircularMenu(ArtDecoElement):
         pygame.draw.circle(surface, Colors.DEEP_BLACK, (self.center_x, self.center_y), self.radius)
         
         # Dessiner les éléments du menu
-        item_count = len(self.items)
-        angle_step = 2 * math.pi / item_count
-        
-        for i, item in enumerate(self.items):
-            # Calculer la position
-            angle = (i * angle_step) + self.rotation_angle
-            item_radius = self.radius - 60
-            x = self.center_x + math.cos(angle) * item_radius
-            y = self.center_y + math.sin(angle) * item_radius
-            
+        for i, (item, (x, y)) in enumerate(zip(self.items, self._item_positions())):
             # Déterminer si c'est l'élément sélectionné
             is_selected = i == self.selected_index
             
@@ -604,29 +795,22 @@ class CircularMenu(ArtDecoElement):
             
             # Dessiner le cercle de l'élément
             item_size = 45 if is_selected else 35
-            pygame.draw.circle(surface, bg_color, (int(x), int(y)), item_size)
-            pygame.draw.circle(surface, Colors.BRONZE, (int(x), int(y)), item_size, 3)
+            pygame.draw.circle(surface, bg_color, (x, y), item_size)
+            pygame.draw.circle(surface, Colors.BRONZE, (x, y), item_size, 3)
             
             # Dessiner le texte
             font = fonts.get('small')
-            text_surface = font.render(item, True, text_color)
-            text_rect = text_surface.get_rect(center=(int(x), int(y)))
+            text_surface = render_text(font, item, text_color)
+            text_rect = text_surface.get_rect(center=(x, y))
             surface.blit(text_surface, text_rect)
             
             # Effet de brillance pour l'élément sélectionné
             if is_selected:
-                self._draw_selection_glow(surface, (int(x), int(y)), item_size)
+                self._draw_selection_glow(surface, (x, y), item_size)
     
     def _draw_selection_glow(self, surface: pygame.Surface, center: Tuple[int, int], radius: int):
         """Dessine un effet de brillance pour l'élément sélectionné"""
-        glow_surface = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
-        
-        for r in range(radius, radius * 2, 2):
-            alpha = int(30 * (1 - (r - radius) / radius))
-            color = (*Colors.GOLD[:3], alpha)
-            pygame.draw.circle(glow_surface, color, (radius * 2, radius * 2), r)
-        
-        surface.blit(glow_surface, (center[0] - radius * 2, center[1] - radius * 2))
+        surface.blit(_selection_glow(radius), (center[0] - radius * 2, center[1] - radius * 2))
     
     def rotate_to_item(self, index: int):
         """Fait tourner le menu vers un élément"""
@@ -636,34 +820,78 @@ class CircularMenu(ArtDecoElement):
             self.target_rotation = -index * angle_step
             self.is_rotating = True
     
-    def update(self):
+    def update(self, dt: float = 1 / 60):
         """Met à jour les animations"""
         if self.is_rotating:
-            # Interpolation fluide vers la rotation cible
-            diff = self.target_rotation - self.rotation_angle
-            if abs(diff) > 0.01:
-                self.rotation_angle += diff * 0.1
+            # Ressort vers la rotation cible, par l'arc le plus court
+            diff = (self.target_rotation - self.rotation_angle + math.pi) % (2 * math.pi) - math.pi
+            if abs(diff) > 0.01 or abs(self._velocity) > 0.01:
+                self.rotation_angle, self._velocity = _spring_step(
+                    self.rotation_angle, self._velocity, self.rotation_angle + diff, dt)
             else:
                 self.rotation_angle = self.target_rotation
+                self._velocity = 0.0
                 self.is_rotating = False
 
 class CocktailCard(ArtDecoElement):
     """Carte de cocktail avec design Art Déco"""
     
+    _MARGIN = 10  # Débord du halo (et de l'ombre) autour de la carte
+    _SCALE_STEPS = 200  # Pas de 0.005 pour les rendus de l'animation d'échelle
+    
     def __init__(self, x: int, y: int, width: int, height: int, cocktail_data: Dict):
         super().__init__(x, y, width, height)
         self.cocktail_data = cocktail_data
         self.scale = 1.0
         self.target_scale = 1.0
         self.glow_intensity = 0
+        self._velocity = 0.0
         
+        # Rendus mis en cache par état : un seul blit par frame
+        self._cache: Dict[tuple, pygame.Surface] = {}
+        
+    def _scale_bucket(self) -> int:
+        """Échelle arrondie : l'animation réutilise une dizaine de rendus"""
+        return round(self.scale * self._SCALE_STEPS)
+    
+    def _state_key(self, fonts: Fonts) -> tuple:
+        """Clé de cache du rendu actuel"""
+        return (self._scale_bucket(), self.glow_intensity, self.width, self.height, id(fonts))
+    
+    def invalidate(self):
+        """Oublie les rendus en cache (données du cocktail modifiées)"""
+        self._cache.clear()
+    
+    def get_surface(self, fonts: Fonts) -> pygame.Surface:
+        """Rendu de la carte dans l'état actuel, rastérisé à la première demande"""
+        key = self._state_key(fonts)
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = self._cache[key] = self._render_to_surface(fonts)
+        return cached
+    
     def draw(self, surface: pygame.Surface, fonts: Fonts):
         """Dessine la carte de cocktail"""
+        surface.blit(self.get_surface(fonts), self._surface_pos())
+    
+    def _scaled_size(self) -> Tuple[int, int]:
+        scale = self._scale_bucket() / self._SCALE_STEPS
+        return int(self.width * scale), int(self.height * scale)
+    
+    def _surface_pos(self) -> Tuple[int, int]:
+        """Position à l'écran du coin de la surface en cache"""
+        scaled_width, scaled_height = self._scaled_size()
+        return (self.x + (self.width - scaled_width) // 2 - self._MARGIN,
+                self.y + (self.height - scaled_height) // 2 - self._MARGIN)
+    
+    def _render_to_surface(self, fonts: Fonts) -> pygame.Surface:
+        """Rastérise la carte (ombre et halo compris) sur une surface transparente"""
         # Calculer les dimensions avec mise à l'échelle
-        scaled_width = int(self.width * self.scale)
-        scaled_height = int(self.height * self.scale)
-        scaled_x = self.x + (self.width - scaled_width) // 2
-        scaled_y = self.y + (self.height - scaled_height) // 2
+        scaled_width, scaled_height = self._scaled_size()
+        margin = self._MARGIN
+        surface = pygame.Surface((scaled_width + margin * 2, scaled_height + margin * 2),
+                                 pygame.SRCALPHA)
+        scaled_x = scaled_y = margin
         
         # Fond de la carte
         card_rect = pygame.Rect(scaled_x, scaled_y, scaled_width, scaled_height)
@@ -682,7 +910,7 @@ class CocktailCard(ArtDecoElement):
         # Titre du cocktail
         font_title = fonts.get('subtitle')
         title = self.cocktail_data.get('name', 'Cocktail')
-        title_surface = font_title.render(title, True, Colors.DEEP_BLACK)
+        title_surface = render_text(font_title, title, Colors.DEEP_BLACK)
         title_rect = title_surface.get_rect(centerx=card_rect.centerx, 
                                           y=card_rect.y + 20)
         surface.blit(title_surface, title_rect)
@@ -698,7 +926,7 @@ class CocktailCard(ArtDecoElement):
         
         for ingredient in ingredients[:6]:  # Maximum 6 ingrédients visibles
             ing_text = f"• {ingredient.get('name', '')} ({ingredient.get('amount', '')})"
-            ing_surface = font_ingredient.render(ing_text, True, Colors.CHARCOAL)
+            ing_surface = render_text(font_ingredient, ing_text, Colors.CHARCOAL)
             ing_rect = ing_surface.get_rect(x=card_rect.x + 20, y=y_offset)
             surface.blit(ing_surface, ing_rect)
             y_offset += 25
@@ -706,57 +934,14 @@ class CocktailCard(ArtDecoElement):
         # Effet de brillance
         if self.glow_intensity > 0:
             self._draw_glow_effect(surface, card_rect)
+        
+        return _prepare_surface(surface)
     
     def _draw_decorative_borders(self, surface: pygame.Surface, rect: pygame.Rect):
         """Dessine les bordures décoratives Art Déco"""
-        # Coins ornementaux
-        corner_size = 15
-        
         # Motifs géométriques dans les coins
-        for corner in ['tl', 'tr', 'bl', 'br']:
-            self._draw_corner_pattern(surface, rect, corner, corner_size)
-    
-    def _draw_corner_pattern(self, surface: pygame.Surface, rect: pygame.Rect, 
-                           corner: str, size: int):
-        """Dessine un motif dans un coin spécifique"""
-        if corner == 'tl':  # Top-left
-            base_x, base_y = rect.x + 10, rect.y + 10
-            points = [
-                (base_x, base_y + size),
-                (base_x + size//2, base_y),
-                (base_x + size, base_y + size//2),
-                (base_x + size//2, base_y + size),
-                (base_x, base_y + size//2)
-            ]
-        elif corner == 'tr':  # Top-right
-            base_x, base_y = rect.x + rect.width - 10 - size, rect.y + 10
-            points = [
-                (base_x, base_y + size//2),
-                (base_x + size//2, base_y),
-                (base_x + size, base_y + size),
-                (base_x + size//2, base_y + size),
-                (base_x + size, base_y + size//2)
-            ]
-        elif corner == 'bl':  # Bottom-left
-            base_x, base_y = rect.x + 10, rect.y + rect.height - 10 - size
-            points = [
-                (base_x, base_y + size//2),
-                (base_x + size//2, base_y + size),
-                (base_x + size, base_y + size//2),
-                (base_x + size//2, base_y),
-                (base_x, base_y)
-            ]
-        else:  # Bottom-right
-            base_x, base_y = rect.x + rect.width - 10 - size, rect.y + rect.height - 10 - size
-            points = [
-                (base_x + size, base_y),
-                (base_x + size//2, base_y + size),
-                (base_x, base_y + size//2),
-                (base_x + size//2, base_y),
-                (base_x + size, base_y + size//2)
-            ]
-        
-        pygame.draw.polygon(surface, Colors.BRONZE, points)
+        for points in _corner_pattern_polys(rect.x, rect.y, rect.width, rect.height):
+            pygame.draw.polygon(surface, Colors.BRONZE, points)
     
     def _draw_decorative_separator(self, surface: pygame.Surface, center_x: int, y: int):
         """Dessine un séparateur décoratif"""
@@ -765,14 +950,7 @@ class CocktailCard(ArtDecoElement):
                         (center_x - 60, y), (center_x + 60, y), 2)
         
         # Losange central
-        diamond_size = 6
-        points = [
-            (center_x, y - diamond_size),
-            (center_x + diamond_size, y),
-            (center_x, y + diamond_size),
-            (center_x - diamond_size, y)
-        ]
-        pygame.draw.polygon(surface, Colors.GOLD, points)
+        pygame.draw.polygon(surface, Colors.GOLD, _separator_diamond(center_x, y))
         
         # Petits cercles aux extrémités
         pygame.draw.circle(surface, Colors.BRONZE, (center_x - 65, y), 4)
@@ -796,11 +974,15 @@ class CocktailCard(ArtDecoElement):
         self.target_scale = 1.05 if highlight else 1.0
         self.glow_intensity = 30 if highlight else 0
     
-    def update(self):
+    def update(self, dt: float = 1 / 60):
         """Met à jour les animations"""
-        # Animation de mise à l'échelle
-        if abs(self.scale - self.target_scale) > 0.001:
-            self.scale += (self.target_scale - self.scale) * 0.1
+        # Animation de mise à l'échelle (ressort : la vitesse survit aux changements de cible)
+        if abs(self.scale - self.target_scale) > 0.001 or abs(self._velocity) > 0.001:
+            self.scale, self._velocity = _spring_step(self.scale, self._velocity,
+                                                      self.target_scale, dt)
+        else:
+            self.scale = self.target_scale
+            self._velocity = 0.0
 
 class CocktailCarousel:
     """Carrousel de cocktails avec navigation tactile horizontale"""
@@ -972,7 +1154,7 @@ class CocktailCarousel:
         # Nom du cocktail
         font_size = 'title' if is_active else 'subtitle'
         font = self.fonts.get(font_size)
-        name_surface = font.render(cocktail['name'], True, Colors.GOLD)
+        name_surface = render_text(font, cocktail['name'], Colors.GOLD)
         name_rect = name_surface.get_rect(center=(width//2, int(420 * scale)))
         surface.blit(name_surface, name_rect)
         
@@ -983,7 +1165,7 @@ class CocktailCarousel:
             y_offset = int(460 * scale)
             
             for line in desc_lines[:2]:  # Max 2 lignes
-                line_surface = desc_font.render(line, True, Colors.CREAM)
+                line_surface = render_text(desc_font, line, Colors.CREAM)
                 line_rect = line_surface.get_rect(center=(width//2, y_offset))
                 surface.blit(line_surface, line_rect)
                 y_offset += 25
@@ -1100,7 +1282,7 @@ class IngredientPanel:
         # Titre
         title_font = self.fonts.get('subtitle')
         title = "INGRÉDIENTS"
-        title_surface = title_font.render(title, True, Colors.GOLD)
+        title_surface = render_text(title_font, title, Colors.GOLD)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH//2, 50))
         panel_surface.blit(title_surface, title_rect)
         
@@ -1130,10 +1312,10 @@ class IngredientPanel:
         name = ingredient['name']
         amount = f"{ingredient['amount_ml']}ml"
         
-        name_surface = font.render(name, True, Colors.CREAM)
+        name_surface = render_text(font, name, Colors.CREAM)
         surface.blit(name_surface, (50, y_pos))
         
-        amount_surface = font.render(amount, True, Colors.GOLD)
+        amount_surface = render_text(font, amount, Colors.GOLD)
         amount_rect = amount_surface.get_rect(right=SCREEN_WIDTH - 150, y=y_pos)
         surface.blit(amount_surface, amount_rect)
         
@@ -1183,7 +1365,7 @@ class SettingsPanel:
         # Titre
         title_font = self.fonts.get('subtitle')
         title = "PARAMÈTRES"
-        title_surface = title_font.render(title, True, Colors.GOLD)
+        title_surface = render_text(title_font, title, Colors.GOLD)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH//2, 50))
         panel_surface.blit(title_surface, title_rect)
         
@@ -1218,7 +1400,7 @@ class SettingsPanel:
             
             # Texte option
             font = self.fonts.get('medium')
-            text_surface = font.render(option, True, Colors.CREAM)
+            text_surface = render_text(font, option, Colors.CREAM)
             text_rect = text_surface.get_rect(center=option_rect.center)
             surface.blit(text_surface, text_rect)
 
@@ -1236,8 +1418,10 @@ class ArtDecoInterface:
         
         # États de l'interface
         self.current_screen = "splash"
+        self._frame_time = time.monotonic()
+        set_frame_time(self._frame_time)
         self.transition_time = 0
-        self.last_interaction = time.time()
+        self.last_interaction = self._frame_time
         
         # Éléments UI
         self.elements: List[ArtDecoElement] = []
@@ -1248,6 +1432,23 @@ class ArtDecoInterface:
         self.cocktail_carousel = None
         self.ingredient_panel = IngredientPanel(self.fonts)
         self.settings_panel = SettingsPanel(self.fonts)
+        
+        # Textes du splash rendus au premier affichage
+        self._splash_blits = None
+        
+        # Heure du menu principal, re-rendue une fois par minute
+        self._last_time_str = None
+        self._time_surface = None
+        self._time_rect = None
+        
+        # Fond à motifs et masque circulaire, rastérisés une seule fois
+        self._pattern_surface = None
+        self._mask_surface = None
+        
+        # Rendu par zones modifiées (menu principal)
+        self._background_cache = None
+        self._needs_full_redraw = True
+        self._dirty_rects = None
         self.serve_button = None
         
         # Boutons retour pour chaque écran
@@ -1288,6 +1489,9 @@ class ArtDecoInterface:
             logger.error(f"[ERROR] Impossible d'initialiser Pygame: {e}")
             return False
         
+        # Couches statiques du fond
+        self._build_static_layers()
+        
         # Charger les données
         self.load_cocktails()
         
@@ -1443,74 +1647,108 @@ class ArtDecoInterface:
         # Masque circulaire
         self.draw_circular_mask()
         
-        # Titre principal avec animation
-        title_text = "TIPSY"
-        subtitle_text = "MACHINE À COCKTAILS ÉLITE"
-        tagline_text = "Style 1920 • Sophistication • Excellence"
-        
-        # Animation du titre
-        alpha = min(255, int(255 * (time.time() - self.transition_time)))
+        # Textes statiques rendus une seule fois
+        if self._splash_blits is None:
+            self._splash_blits = self._render_splash_texts()
         
-        # Titre principal
-        title_font = self.fonts.get('title_huge')
-        title_surface = title_font.render(title_text, True, Colors.GOLD)
-        title_surface.set_alpha(alpha)
-        title_rect = title_surface.get_rect(center=(CENTER_X, CENTER_Y - 80))
-        self.screen.blit(title_surface, title_rect)
-        
-        # Sous-titre
-        subtitle_font = self.fonts.get('large')
-        subtitle_surface = subtitle_font.render(subtitle_text, True, Colors.CREAM)
-        subtitle_surface.set_alpha(alpha)
-        subtitle_rect = subtitle_surface.get_rect(center=(CENTER_X, CENTER_Y - 20))
-        self.screen.blit(subtitle_surface, subtitle_rect)
-        
-        # Tagline
-        tagline_font = self.fonts.get('medium')
-        tagline_surface = tagline_font.render(tagline_text, True, Colors.SILVER)
-        tagline_surface.set_alpha(alpha)
-        tagline_rect = tagline_surface.get_rect(center=(CENTER_X, CENTER_Y + 20))
-        self.screen.blit(tagline_surface, tagline_rect)
+        # Animation du titre : seul l'alpha des surfaces change
+        alpha = min(255, int(255 * (self._frame_time - self.transition_time)))
+        for text_surface, _ in self._splash_blits:
+            text_surface.set_alpha(alpha)
+        _blit_all(self.screen, self._splash_blits)
         
         # Ornements Art Déco
         if alpha > 200:
             self.draw_art_deco_ornaments()
         
         # Auto-transition après 3 secondes
-        if time.time() - self.transition_time > 3:
+        if self._frame_time - self.transition_time > 3:
             self.switch_screen("main_menu")
     
+    def _render_splash_texts(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Titre, sous-titre et tagline du splash, avec leur position"""
+        texts = [
+            ("TIPSY", 'title_huge', Colors.GOLD, CENTER_Y - 80),
+            ("MACHINE À COCKTAILS ÉLITE", 'large', Colors.CREAM, CENTER_Y - 20),
+            ("Style 1920 • Sophistication • Excellence", 'medium', Colors.SILVER, CENTER_Y + 20),
+        ]
+        blits = []
+        for text, font_name, color, center_y in texts:
+            text_surface = self.fonts.get(font_name).render(text, True, color)
+            blits.append((text_surface, text_surface.get_rect(center=(CENTER_X, center_y)).topleft))
+        return blits
+    
     def draw_main_menu(self):
-        """Dessine le menu principal"""
-        self.draw_background()
-        self.draw_circular_mask()
+        """Dessine le menu principal
         
-        # Titre du menu
-        title_font = self.fonts.get('title')
-        title_surface = title_font.render("MENU PRINCIPAL", True, Colors.GOLD)
-        title_rect = title_surface.get_rect(center=(CENTER_X, CENTER_Y - 200))
-        self.screen.blit(title_surface, title_rect)
-        
-        # Dessiner les boutons
-        for button in self.main_menu_buttons:
-            button.draw(self.screen, self.fonts)
+        Écran presque statique : après un premier rendu complet, seules les
+        zones des boutons qui changent d'état et de l'heure sont repeintes.
+        """
+        background = self._get_static_background()
+        full_redraw = self._needs_full_redraw
+        dirty_rects = []
         
-        # Heure actuelle
+        if full_redraw:
+            self.screen.blit(background, (0, 0))
+            
+            # Titre du menu
+            title_font = self.fonts.get('title')
+            title_surface = render_text(title_font, "MENU PRINCIPAL", Colors.GOLD)
+            title_rect = title_surface.get_rect(center=(CENTER_X, CENTER_Y - 200))
+            self.screen.blit(title_surface, title_rect)
+            
+            changed_buttons = self.main_menu_buttons
+        else:
+            changed_buttons = [button for button in self.main_menu_buttons
+                               if button._state_key(self.fonts) != button._drawn_key]
+            # Restaurer le fond sous les boutons modifiés
+            for button in changed_buttons:
+                rect = button.screen_rect
+                self.screen.blit(background, rect, rect)
+                dirty_rects.append(rect)
+        
+        # Dessiner les boutons (rendus en cache, un seul appel de blit)
+        if changed_buttons:
+            margin = ArtDecoButton._MARGIN
+            _blit_all(self.screen, [
+                (button.get_surface(self.fonts), (button.x - margin, button.y - margin))
+                for button in changed_buttons
+            ])
+            for button in changed_buttons:
+                button._drawn_key = button._state_key(self.fonts)
+        
+        # Heure actuelle, rendue seulement quand la minute change
         current_time = time.strftime("%H:%M")
-        time_font = self.fonts.get('small')
-        time_surface = time_font.render(current_time, True, Colors.SILVER)
-        time_rect = time_surface.get_rect(center=(CENTER_X, CENTER_Y + 180))
-        self.screen.blit(time_surface, time_rect)
+        if full_redraw or current_time != self._last_time_str:
+            if self._time_rect is not None and not full_redraw:
+                self.screen.blit(background, self._time_rect, self._time_rect)
+                dirty_rects.append(self._time_rect)
+            time_font = self.fonts.get('small')
+            self._time_surface = time_font.render(current_time, True, Colors.SILVER)
+            self._last_time_str = current_time
+            self._time_rect = self._time_surface.get_rect(center=(CENTER_X, CENTER_Y + 180))
+            self.screen.blit(self._time_surface, self._time_rect)
+            dirty_rects.append(self._time_rect)
+        
+        # None : l'écran entier est à présenter
+        self._dirty_rects = None if full_redraw else dirty_rects
+        self._needs_full_redraw = False
+    
+    def _get_static_background(self) -> pygame.Surface:
+        """Fond et masque circulaire composés une fois, réutilisés à chaque frame"""
+        if self._background_cache is None:
+            self.draw_background()
+            self.draw_circular_mask()
+            self._background_cache = self.screen.copy()
+        return self._background_cache
     
     def draw_background(self):
-        """Dessine le fond Art Déco"""
-        # Fond base
-        self.screen.fill(Colors.DEEP_BLACK)
-        
-        # Motifs géométriques subtils
-        self.draw_background_pattern()
+        """Dessine le fond Art Déco (fond et motifs rastérisés une seule fois)"""
+        if self._pattern_surface is None:
+            self._build_static_layers()
+        self.screen.blit(self._pattern_surface, (0, 0))
     
-    def draw_background_pattern(self):
+    def draw_background_pattern(self, surface: pygame.Surface):
         """Dessine les motifs de fond Art Déco"""
         # Lignes radiales subtiles
         for i in range(12):
@@ -1523,35 +1761,41 @@ class ArtDecoInterface:
             end_x = CENTER_X + math.cos(angle) * end_radius
             end_y = CENTER_Y + math.sin(angle) * end_radius
             
-            pygame.draw.line(self.screen, Colors.CHARCOAL, 
+            pygame.draw.line(surface, Colors.CHARCOAL, 
                            (start_x, start_y), (end_x, end_y), 1)
         
         # Cercles concentriques
         for radius in [100, 200, 300]:
             if radius < SCREEN_RADIUS:
-                pygame.draw.circle(self.screen, Colors.CHARCOAL, 
+                pygame.draw.circle(surface, Colors.CHARCOAL, 
                                  (CENTER_X, CENTER_Y), radius, 1)
     
     def draw_circular_mask(self):
         """Applique le masque circulaire pour l'écran rond"""
-        # Créer un masque pour l'écran circulaire
+        if self._mask_surface is None:
+            self._build_static_layers()
+        self.screen.blit(self._mask_surface, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
+    
+    def _build_static_layers(self):
+        """Rastérise une fois le fond à motifs et le masque circulaire"""
+        # Fond base et motifs géométriques subtils
+        pattern_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pattern_surface.fill(Colors.DEEP_BLACK)
+        self.draw_background_pattern(pattern_surface)
+        self._pattern_surface = pattern_surface.convert()
+        
+        # Masque : tout en noir, cercle transparent percé au centre
         mask_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        
-        # Remplir tout en noir
         mask_surface.fill(Colors.PURE_BLACK)
-        
-        # Percer le cercle transparent
         pygame.draw.circle(mask_surface, (0, 0, 0, 0), 
                           (CENTER_X, CENTER_Y), SCREEN_RADIUS)
         
-        # Bordure dorée
-        pygame.draw.circle(self.screen, Colors.GOLD, 
+        # Bordure dorée, dans le cercle : intégrée au masque
+        pygame.draw.circle(mask_surface, Colors.GOLD, 
                           (CENTER_X, CENTER_Y), SCREEN_RADIUS, 5)
-        pygame.draw.circle(self.screen, Colors.DARK_GOLD, 
+        pygame.draw.circle(mask_surface, Colors.DARK_GOLD, 
                           (CENTER_X, CENTER_Y), SCREEN_RADIUS - 8, 2)
-        
-        # Appliquer le masque
-        self.screen.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
+        self._mask_surface = mask_surface.convert_alpha()
     
     def draw_art_deco_ornaments(self):
         """Dessine les ornements Art Déco décoratifs"""
@@ -1567,26 +1811,16 @@ class ArtDecoInterface:
     
     def draw_art_deco_star(self, x: float, y: float, size: int):
         """Dessine une étoile Art Déco"""
-        points = []
-        for i in range(8):
-            angle = (i * 45) * math.pi / 180
-            if i % 2 == 0:
-                radius = size
-            else:
-                radius = size // 2
-            
-            point_x = x + math.cos(angle) * radius
-            point_y = y + math.sin(angle) * radius
-            points.append((point_x, point_y))
-        
+        points = _star_points(x, y, size)
         pygame.draw.polygon(self.screen, Colors.GOLD, points)
         pygame.draw.polygon(self.screen, Colors.BRONZE, points, 1)
     
     def switch_screen(self, new_screen: str):
         """Change d'écran avec transition"""
         self.current_screen = new_screen
-        self.transition_time = time.time()
-        self.last_interaction = time.time()
+        self._needs_full_redraw = True
+        self.transition_time = self._frame_time
+        self.last_interaction = self._frame_time
         logger.info(f"Basculement vers écran: {new_screen}")
     
     def register_gesture_callbacks(self):
@@ -1712,9 +1946,10 @@ class ArtDecoInterface:
                     self.running = False
                 elif event.key == pygame.K_f:
                     pygame.display.toggle_fullscreen()
+                    self._needs_full_redraw = True
             
             elif event.type in [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION]:
-                self.last_interaction = time.time()
+                self.last_interaction = self._frame_time
                 
                 # Traitement des gestes tactiles
                 gesture_event = self.gesture_manager.handle_event(event)
@@ -1782,11 +2017,17 @@ class ArtDecoInterface:
     def start_animation_thread(self):
         """Démarre le thread d'animation"""
         def animation_loop():
+            last_tick = time.monotonic()
             while not self.stop_animations:
+                # Pas de temps réel écoulé depuis la dernière mise à jour
+                now = time.monotonic()
+                dt = now - last_tick
+                last_tick = now
+                
                 # Mettre à jour les animations des éléments
                 for element in self.elements:
                     if hasattr(element, 'update'):
-                        element.update()
+                        element.update(dt)
                 
                 time.sleep(1/60)  # 60 FPS
         
@@ -1796,6 +2037,10 @@ class ArtDecoInterface:
     def run(self):
         """Boucle principale de l'interface"""
         while self.running:
+            # Une seule lecture d'horloge par frame, partagée par les animations
+            self._frame_time = time.monotonic()
+            set_frame_time(self._frame_time)
+            
             # Gérer les événements
             self.handle_events()
             
@@ -1813,7 +2058,7 @@ class ArtDecoInterface:
     def update(self):
         """Met à jour la logique de l'interface"""
         # Vérifier l'inactivité pour revenir au splash
-        if time.time() - self.last_interaction > 60:  # 1 minute
+        if self._frame_time - self.last_interaction > 60:  # 1 minute
             if self.current_screen != "splash":
                 self.switch_screen("splash")
     
@@ -1830,7 +2075,14 @@ class ArtDecoInterface:
         elif self.current_screen == "settings":
             self.draw_settings_screen()
         
-        pygame.display.flip()
+        if self.current_screen != "main_menu":
+            self._dirty_rects = None
+        
+        # Seules les zones modifiées sont envoyées à l'écran quand c'est possible
+        if self._dirty_rects is None:
+            pygame.display.flip()
+        elif self._dirty_rects:
+            pygame.display.update(self._dirty_rects)
     
     def draw_cocktail_menu(self):
         """Dessine le menu des cocktails avec carrousel tactile"""
@@ -1839,7 +2091,7 @@ class ArtDecoInterface:
         
         # Titre
         title_font = self.fonts.get('title')
-        title_surface = title_font.render("COCKTAILS", True, Colors.GOLD)
+        title_surface = render_text(title_font, "COCKTAILS", Colors.GOLD)
         title_rect = title_surface.get_rect(center=(CENTER_X, 80))
         self.screen.blit(title_surface, title_rect)
         
@@ -1865,7 +2117,7 @@ class ArtDecoInterface:
         
         help_y = SCREEN_HEIGHT - 120
         for text in help_texts:
-            help_surface = help_font.render(text, True, Colors.SILVER)
+            help_surface = render_text(help_font, text, Colors.SILVER)
             help_rect = help_surface.get_rect(center=(CENTER_X, help_y))
             self.screen.blit(help_surface, help_rect)
             help_y += 25
@@ -1895,14 +2147,14 @@ class ArtDecoInterface:
         
         # Titre
         title_font = self.fonts.get('title')
-        title_surface = title_font.render("NETTOYAGE", True, Colors.GOLD)
+        title_surface = render_text(title_font, "NETTOYAGE", Colors.GOLD)
         title_rect = title_surface.get_rect(center=(CENTER_X, CENTER_Y - 100))
         self.screen.blit(title_surface, title_rect)
         
         # Message
         font = self.fonts.get('medium')
         message = "Système de nettoyage automatique"
-        msg_surface = font.render(message, True, Colors.CREAM)
+        msg_surface = render_text(font, message, Colors.CREAM)
         msg_rect = msg_surface.get_rect(center=(CENTER_X, CENTER_Y))
         self.screen.blit(msg_surface, msg_rect)
         
@@ -1918,14 +2170,14 @@ class ArtDecoInterface:
         
         # Titre
         title_font = self.fonts.get('title')
-        title_surface = title_font.render("PARAMÈTRES", True, Colors.GOLD)
+        title_surface = render_text(title_font, "PARAMÈTRES", Colors.GOLD)
         title_rect = title_surface.get_rect(center=(CENTER_X, CENTER_Y - 100))
         self.screen.blit(title_surface, title_rect)
         
         # Message
         font = self.fonts.get('medium')
         message = "Configuration et maintenance"
-        msg_surface = font.render(message, True, Colors.CREAM)
+        msg_surface = render_text(font, message, Colors.CREAM)
         msg_rect = msg_surface.get_rect(center=(CENTER_X, CENTER_Y))
         self.screen.blit(msg_surface, msg_rect)
         
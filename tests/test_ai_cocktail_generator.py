@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du générateur IA de cocktails
+Tests unitaires des fonctions pures : clés de cache, streaming, parsing et backoff
+"""
+import asyncio
+import pytest
+import unittest.mock as mock
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+pytest.importorskip("openai")
+pytest.importorskip("httpx")
+
+from src.ai_cocktail_generator import CocktailAI, _StreamBuffer, _RETRY_AFTER_MAX
+
+
+def _api_error(retry_after=None):
+    """Erreur API factice portant (ou non) un en-tête Retry-After"""
+    headers = {} if retry_after is None else {"retry-after": retry_after}
+    return SimpleNamespace(response=SimpleNamespace(headers=headers))
+
+
+class TestCacheKey:
+    """Tests de la clé canonique de prepare_generation"""
+
+    def setup_method(self):
+        self.ai = CocktailAI()
+
+    def test_ingredient_order_and_case(self):
+        """Ordre, casse et espaces des ingrédients sans effet sur la clé"""
+        _, key_a = self.ai.prepare_generation(["Gin", "Vodka"], "classic", 3, 3)
+        _, key_b = self.ai.prepare_generation(["  vodka", "GIN "], "classic", 3, 3)
+        assert key_a == key_b
+
+    def test_special_request_whitespace(self):
+        """Espaces multiples et casse de la demande spéciale normalisés"""
+        _, key_a = self.ai.prepare_generation(["Gin"], special_request="Pour  une Soirée")
+        _, key_b = self.ai.prepare_generation(["gin"], special_request="pour une soirée")
+        assert key_a == key_b
+
+    def test_parameters_change_key(self):
+        """Force, complexité et style distinguent les clés"""
+        _, base = self.ai.prepare_generation(["Gin"], "classic", 3, 3)
+        assert self.ai.prepare_generation(["Gin"], "classic", 4, 3)[1] != base
+        assert self.ai.prepare_generation(["Gin"], "classic", 3, 4)[1] != base
+        assert self.ai.prepare_generation(["Gin"], "modern", 3, 3)[1] != base
+
+    def test_prompt_keeps_original_ingredients(self):
+        """Seule la clé est canonique : le prompt garde la saisie d'origine"""
+        prompt, _ = self.ai.prepare_generation(["Gin", "Vodka"])
+        assert "Gin, Vodka" in prompt
+
+
+class _FakeStream:
+    """Flux de fragments de réponse, à la manière de l'API en streaming"""
+
+    def __init__(self, fragments):
+        self.fragments = fragments
+        self.consumed = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.consumed >= len(self.fragments):
+            raise StopAsyncIteration
+        fragment = self.fragments[self.consumed]
+        self.consumed += 1
+        return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=fragment))])
+
+    async def close(self):
+        self.closed = True
+
+
+class TestStreaming:
+    """Tests de la réception en streaming"""
+
+    def test_buffer_completion(self):
+        """Le buffer ne se dit complet qu'après une accolade fermante"""
+        buffer = _StreamBuffer()
+        buffer.append('{"name": ')
+        assert not buffer.looks_complete()
+        buffer.append(None)
+        buffer.append('"Gin"}  \n')
+        assert buffer.looks_complete()
+        assert buffer.text() == '{"name": "Gin"}  \n'
+
+    def test_stops_at_first_complete_json(self):
+        """Le flux est abandonné dès le premier objet JSON complet"""
+        stream = _FakeStream(['```json\n{"name": ', '{"a": 1}', ', "b": 2}', '\n```', 'fin'])
+        client = mock.Mock()
+        client.chat.completions.create = mock.AsyncMock(return_value=stream)
+
+        ai = CocktailAI()
+        with mock.patch.object(CocktailAI, 'client', new_callable=mock.PropertyMock,
+                               return_value=client):
+            text = asyncio.run(ai._stream_completion("prompt"))
+
+        assert text == '```json\n{"name": {"a": 1}, "b": 2}'
+        assert stream.consumed == 3
+        assert stream.closed
+
+
+class TestCleanJsonResponse:
+    """Tests de l'extraction du JSON des réponses"""
+
+    def setup_method(self):
+        self.ai = CocktailAI()
+
+    def test_bare_json_fast_path(self):
+        """JSON pur retourné tel quel, sans les espaces autour"""
+        assert self.ai._clean_json_response('  {"name": "Gin"}\n') == '{"name": "Gin"}'
+
+    def test_markdown_fence(self):
+        """Bloc markdown ```json retiré"""
+        response = '```json\n{"name": "Gin"}\n```'
+        assert self.ai._clean_json_response(response) == '{"name": "Gin"}'
+
+    def test_surrounding_text(self):
+        """Texte avant et après le JSON retiré"""
+        response = 'Voici votre cocktail :\n{"name": "Gin"}\nBonne dégustation !'
+        assert self.ai._clean_json_response(response) == '{"name": "Gin"}'
+
+
+class TestRetryDelay:
+    """Tests du délai avant nouvelle tentative"""
+
+    def test_retry_after_seconds(self):
+        """Retry-After en secondes respecté"""
+        assert CocktailAI._retry_delay(_api_error("2.5"), 0) == 2.5
+
+    def test_retry_after_capped(self):
+        """Retry-After excessif plafonné"""
+        assert CocktailAI._retry_delay(_api_error("3600"), 0) == _RETRY_AFTER_MAX
+
+    def test_retry_after_http_date(self):
+        """Retry-After en date HTTP converti en délai"""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        delay = CocktailAI._retry_delay(_api_error(format_datetime(retry_at, usegmt=True)), 0)
+        assert 25 <= delay <= 30
+
+    def test_retry_after_past_date(self):
+        """Date HTTP déjà passée : nouvelle tentative immédiate"""
+        retry_at = datetime.now(timezone.utc) - timedelta(minutes=5)
+        assert CocktailAI._retry_delay(_api_error(format_datetime(retry_at, usegmt=True)), 0) == 0.0
+
+    def test_jitter_without_header(self):
+        """Sans en-tête : jitter complet borné par le backoff exponentiel"""
+        for attempt in range(3):
+            for error in (_api_error(), _api_error("invalide"), Exception()):
+                delay = CocktailAI._retry_delay(error, attempt)
+                assert 0 <= delay <= 2 ** (attempt + 1)
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+Tests de l'écran de réglages Kivy
+Tests unitaires de la saisie des volumes de calibration
+"""
+import pytest
+
+pytest.importorskip("kivy")
+
+from cocktail_machine.screens.settings import _parse_volume
+
+
+class TestParseVolume:
+    """Tests de la conversion des volumes saisis"""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("100", 100.0),
+        ("12.5", 12.5),
+        (".5", 0.5),
+        ("50.", 50.0),
+        (" 25 ", 25.0),
+    ])
+    def test_valid_input(self, text, expected):
+        """Saisies numériques converties en float"""
+        assert _parse_volume(text) == expected
+
+    @pytest.mark.parametrize("text", ["", "abc", "12,5", "1.2.3", "-"])
+    def test_invalid_input(self, text):
+        """Saisies non numériques : None, sans exception"""
+        assert _parse_volume(text) is None
+
+    def test_negative_input(self):
+        """Volume négatif converti : la plage est vérifiée par l'appelant"""
+        assert _parse_volume("-10") == -10.0
+
+    def test_numeric_passthrough(self):
+        """Valeur déjà numérique retournée sans analyse"""
+        assert _parse_volume(250) == 250
+        assert _parse_volume(12.5) == 12.5